@@ -9,10 +9,14 @@ and generates a comprehensive testing strategy report using OpenAI's API.
 import os
 import sys
 import json
+import hashlib
+import pickle
 import tempfile
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import islice
 from pathlib import Path
 import subprocess
 from dotenv import load_dotenv
@@ -29,6 +33,40 @@ logger = logging.getLogger("llm_integration_test")
 # Load environment variables
 load_dotenv()
 
+# Programming language of each source file extension
+LANGUAGE_EXTENSIONS = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'JavaScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.c': 'C',
+    '.cpp': 'C++',
+    '.h': 'C/C++',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.rs': 'Rust',
+    '.scala': 'Scala',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.sql': 'SQL',
+}
+
+# Non-code files included in the scan for context
+DOCUMENT_EXTENSIONS = frozenset({'.json', '.yaml', '.yml', '.xml', '.md'})
+
+# Files larger than this (in bytes) are never included in the analysis prompt
+MAX_PROMPT_FILE_SIZE = 100000
+
+# Bump whenever scan_repository output changes so stale scan caches are ignored
+SCAN_CACHE_VERSION = "1"
+
+
 @dataclass
 class RepoInfo:
     """Data class to store repository information."""
@@ -67,14 +105,18 @@ class LLMIntegrationTestFramework:
     points and generates a comprehensive testing strategy report.
     """
 
-    def __init__(self, openai_api_key: Optional[str] = None):
+    def __init__(self, openai_api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         Initialize the framework.
 
         Args:
             openai_api_key: OpenAI API key. If not provided, it will be loaded from
                 the OPENAI_API_KEY environment variable.
+            cache_dir: Optional directory for caching scan results by commit SHA
+                and OpenAI responses by prompt.
         """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._responses: Dict[str, str] = {}
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         if not self.openai_api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
@@ -100,9 +142,9 @@ class LLMIntegrationTestFramework:
         temp_dir = tempfile.mkdtemp()
 
         try:
-            # Clone the repository
+            # Clone only the latest commit; the scan reads the working tree alone
             result = subprocess.run(
-                ["git", "clone", repo_url, temp_dir],
+                ["git", "clone", "--depth=1", "--single-branch", repo_url, temp_dir],
                 check=True,
                 capture_output=True,
                 text=True
@@ -113,12 +155,13 @@ class LLMIntegrationTestFramework:
             logger.error(f"Failed to clone repository: {e.stderr}")
             raise RuntimeError(f"Failed to clone repository: {e.stderr}")
 
-    def scan_repository(self, repo_path: str) -> RepoInfo:
+    def scan_repository(self, repo_path: str, max_read_workers: int = 16) -> RepoInfo:
         """
         Scan a repository to extract file information.
 
         Args:
             repo_path: Path to the repository.
+            max_read_workers: Maximum number of files read concurrently.
 
         Returns:
             RepoInfo object containing repository information.
@@ -126,48 +169,151 @@ class LLMIntegrationTestFramework:
         logger.info(f"Scanning repository: {repo_path}")
 
         repo_url = self._get_repo_url(repo_path)
-        files = []
+
+        # Reuse an earlier scan of the same commit
+        cache_path = self._scan_cache_path(repo_path)
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                logger.info(f"Using cached scan: {cache_path}")
+                return replace(cached, url=repo_url, local_path=repo_path)
+            except Exception as e:
+                logger.warning(f"Error loading scan cache {cache_path}: {str(e)}")
+
+        candidates = []
         languages = set()
 
+        # Walked paths all start with this prefix, so relative paths are slices
+        prefix_length = len(os.path.join(repo_path, ''))
+
         # Walk through the repository
-        for root, _, filenames in os.walk(repo_path):
-            for filename in filenames:
-                # Skip hidden files and directories
-                if filename.startswith('.') or '/.git/' in root:
-                    continue
+        for path, filename in self._walk_files(repo_path):
+            # Skip hidden files
+            if filename.startswith('.'):
+                continue
 
-                file_path = Path(root) / filename
-                relative_path = file_path.relative_to(repo_path)
+            # Try to detect language based on file extension
+            dot = filename.rfind('.')
+            ext = filename[dot:].lower() if dot > 0 else ''
+            language = self._detect_language(ext)
+            if language:
+                languages.add(language)
+            elif ext not in DOCUMENT_EXTENSIONS:
+                # Only include relevant files
+                continue
 
-                # Try to detect language based on file extension
-                ext = file_path.suffix.lower()
-                language = self._detect_language(ext)
-                if language:
-                    languages.add(language)
+            candidates.append((path, path[prefix_length:], language))
 
-                # Only include relevant files
-                if language or ext in ['.json', '.yaml', '.yml', '.xml', '.md']:
-                    try:
-                        # Read file content (limit to first 1000 lines to avoid memory issues)
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = ''.join(f.readlines()[:1000])
-
-                        files.append({
-                            'path': str(relative_path),
-                            'language': language,
-                            'content': content if len(content) < 50000 else f"{content[:25000]}... [content truncated] ...{content[-25000:]}",
-                            'size': file_path.stat().st_size
-                        })
-                    except Exception as e:
-                        logger.warning(f"Error reading file {file_path}: {str(e)}")
-
-        return RepoInfo(
+        # Read files on a thread pool so slow storage latency overlaps
+        with ThreadPoolExecutor(max_workers=max_read_workers) as executor:
+            entries = executor.map(lambda candidate: self._read_file_entry(*candidate), candidates)
+            files = [entry for entry in entries if entry is not None]
+
+        repo_info = RepoInfo(
             url=repo_url,
             local_path=repo_path,
             files=files,
             languages=list(languages)
         )
 
+        if cache_path is not None:
+            self._store_scan_cache(cache_path, repo_info)
+
+        return repo_info
+
+    def _scan_cache_path(self, repo_path: str) -> Optional[Path]:
+        """
+        Get the scan cache file for the repository's HEAD commit.
+
+        Returns None when caching is disabled, the path is not a Git
+        repository, or the working tree has uncommitted, untracked or ignored
+        files, any of which the scan would read.
+        """
+        if self.cache_dir is None:
+            return None
+
+        try:
+            head = subprocess.run(
+                ["git", "-C", repo_path, "rev-parse", "HEAD"],
+                check=True,
+                capture_output=True,
+                text=True
+            ).stdout.strip()
+            status = subprocess.run(
+                ["git", "-C", repo_path, "status", "--porcelain", "--ignored"],
+                check=True,
+                capture_output=True,
+                text=True
+            ).stdout
+        except subprocess.CalledProcessError:
+            return None
+
+        if status.strip():
+            return None
+
+        return self.cache_dir / f"scan_{head}_{SCAN_CACHE_VERSION}.pickle"
+
+    def _store_scan_cache(self, cache_path: Path, repo_info: RepoInfo) -> None:
+        """Write scan results to the cache, replacing the file atomically."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(repo_info, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Error writing scan cache {cache_path}: {str(e)}")
+
+    def _walk_files(self, repo_path: str) -> Iterator[Tuple[str, str]]:
+        """
+        Walk a repository with os.scandir, yielding (path, name) for each file.
+
+        Directories are visited in the same order as os.walk, and `.git`
+        directories are pruned instead of walked and filtered file by file.
+        """
+        stack = [repo_path]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if entry.name != '.git' and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        else:
+                            yield entry.path, entry.name
+            except OSError as e:
+                logger.warning(f"Error listing directory {directory}: {str(e)}")
+                continue
+
+            # Reverse so the first subdirectory is walked next
+            stack.extend(reversed(subdirs))
+
+    def _read_file_entry(self, file_path: str, relative_path: str, language: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Read a file into a scan entry, returning None if it cannot be read."""
+        try:
+            size = os.stat(file_path).st_size
+
+            # Files too large for the analysis prompt are listed without content
+            if size > MAX_PROMPT_FILE_SIZE:
+                content = ''
+            else:
+                # Read file content (limit to first 1000 lines to avoid memory issues)
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = ''.join(islice(f, 1000))
+
+            return {
+                'path': relative_path,
+                'language': language,
+                'content': content if len(content) < 50000 else f"{content[:25000]}... [content truncated] ...{content[-25000:]}",
+                'size': size
+            }
+        except Exception as e:
+            logger.warning(f"Error reading file {file_path}: {str(e)}")
+            return None
+
     def _get_repo_url(self, repo_path: str) -> str:
         """Get the remote URL of a Git repository."""
         try:
@@ -183,29 +329,7 @@ class LLMIntegrationTestFramework:
 
     def _detect_language(self, extension: str) -> Optional[str]:
         """Detect programming language based on file extension."""
-        language_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'JavaScript',
-            '.tsx': 'TypeScript',
-            '.java': 'Java',
-            '.c': 'C',
-            '.cpp': 'C++',
-            '.h': 'C/C++',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.rs': 'Rust',
-            '.scala': 'Scala',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.sql': 'SQL',
-        }
-        return language_map.get(extension)
+        return LANGUAGE_EXTENSIONS.get(extension)
 
     def analyze_repository(self, repo_info: RepoInfo) -> Dict[str, Any]:
         """
@@ -224,7 +348,7 @@ class LLMIntegrationTestFramework:
 
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
+            analysis_text = self._complete(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are an expert software architect specializing in integration testing. You analyze code repositories to identify critical components, integration points, and recommend testing strategies."},
@@ -233,8 +357,6 @@ class LLMIntegrationTestFramework:
                 temperature=0.2
             )
 
-            analysis_text = response.choices[0].message.content
-
             # Try to extract JSON from the response
             try:
                 # Look for JSON block in the response
@@ -257,6 +379,50 @@ class LLMIntegrationTestFramework:
             logger.error(f"Error calling OpenAI API: {str(e)}")
             raise
 
+    def _complete(self, **request: Any) -> Optional[str]:
+        """
+        Get a chat completion, reusing earlier responses to the same request.
+
+        Responses are kept for the lifetime of the framework and, when a cache
+        directory is set, on disk so later runs can reuse them too.
+
+        Args:
+            **request: Arguments for chat.completions.create.
+
+        Returns:
+            Content of the response message.
+        """
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+        if key in self._responses:
+            return self._responses[key]
+
+        cache_path = self.cache_dir / f"response_{key}.txt" if self.cache_dir else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                content = cache_path.read_text(encoding='utf-8')
+                logger.info(f"Using cached OpenAI response: {cache_path}")
+                self._responses[key] = content
+                return content
+            except OSError as e:
+                logger.warning(f"Error loading response cache {cache_path}: {str(e)}")
+
+        response = self.client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        if content is None:
+            return content
+
+        self._responses[key] = content
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(content, encoding='utf-8')
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f"Error writing response cache {cache_path}: {str(e)}")
+
+        return content
+
     def _create_analysis_prompt(self, repo_info: RepoInfo) -> str:
         """Create a prompt for the OpenAI API to analyze the repository."""
         # Create a summary of the repository
@@ -270,7 +436,7 @@ class LLMIntegrationTestFramework:
 
         for file in repo_info.files:
             # Skip very large files
-            if file['size'] > 100000:
+            if file['size'] > MAX_PROMPT_FILE_SIZE:
                 continue
 
             # Add file content until we reach the maximum
@@ -287,8 +453,8 @@ class LLMIntegrationTestFramework:
                     'size': file['size']
                 })
 
-        # Create the prompt
-        prompt = f"""
+        # Create the prompt from parts joined once at the end
+        parts = [f"""
         # Repository Analysis Request
 
         Analyze the following GitHub repository to identify integration testing needs:
@@ -314,19 +480,19 @@ class LLMIntegrationTestFramework:
 
         ## Files
 
-        """
+        """]
 
         for file in included_files:
-            prompt += f"""
+            parts.append(f"""
         ### {file['path']} ({file['language'] or 'Unknown'})
 
         ```
         {file['content']}
         ```
 
-        """
+        """)
 
-        prompt += """
+        parts.append("""
         ## Response Format
 
         Please provide your analysis in JSON format with the following structure:
@@ -370,9 +536,9 @@ class LLMIntegrationTestFramework:
         ```
 
         Focus on providing actionable insights for integration testing.
-        """
+        """)
 
-        return prompt
+        return "".join(parts)
 
     def generate_report(self, analysis_result: Dict[str, Any], output_path: Optional[str] = None) -> str:
         """
@@ -557,7 +723,11 @@ class LLMIntegrationTestFramework:
         """
 
 
-def analyze_github_repo(repo_url: str, output_path: Optional[str] = None) -> str:
+def analyze_github_repo(
+    repo_url: str,
+    output_path: Optional[str] = None,
+    cache_dir: Optional[str] = None
+) -> str:
     """
     Analyze a GitHub repository and generate an integration testing report.
 
@@ -565,13 +735,15 @@ def analyze_github_repo(repo_url: str, output_path: Optional[str] = None) -> str
         repo_url: URL of the GitHub repository.
         output_path: Path to save the HTML report. If not provided, a default path
             will be used.
+        cache_dir: Optional directory for caching scan results and OpenAI
+            responses between runs.
 
     Returns:
         Path to the generated report.
     """
     try:
         # Initialize the framework
-        framework = LLMIntegrationTestFramework()
+        framework = LLMIntegrationTestFramework(cache_dir=cache_dir)
 
         # Clone the repository
         repo_path = framework.clone_repository(repo_url)
@@ -596,7 +768,7 @@ if __name__ == "__main__":
 
     # Check command line arguments
     if len(sys.argv) < 2:
-        print(f"Usage: {sys.argv[0]} <github_repo_url> [output_path]")
+        print(f"Usage: {sys.argv[0]} <github_repo_url> [output_path] [cache_dir]")
         sys.exit(1)
 
     # Get repository URL from command line
@@ -605,9 +777,12 @@ if __name__ == "__main__":
     # Get output path if provided
     output_path = sys.argv[2] if len(sys.argv) > 2 else None
 
+    # Get cache directory if provided
+    cache_dir = sys.argv[3] if len(sys.argv) > 3 else None
+
     # Run the analysis
     try:
-        report_path = analyze_github_repo(repo_url, output_path)
+        report_path = analyze_github_repo(repo_url, output_path, cache_dir)
         print(f"Integration testing report generated: {report_path}")
     except Exception as e:
         print(f"Error: {str(e)}")
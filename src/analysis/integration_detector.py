@@ -1,6 +1,6 @@
 """Integration point detection and analysis module."""
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import ast
 import re
 from pathlib import Path
@@ -44,31 +44,35 @@ class IntegrationPointDetector:
             # Log error and skip file if it can't be parsed
             return points
 
+        # Collect the nodes each detector looks at in a single walk
+        functions: List[ast.FunctionDef] = []
+        calls: List[ast.Call] = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                functions.append(node)
+            elif isinstance(node, ast.Call):
+                calls.append(node)
+
         # Detect API endpoints
-        api_points = self._detect_api_endpoints(file_path, tree, content)
-        points.extend(api_points)
+        points.extend(self._detect_api_endpoints(file_path, functions))
 
-        # Detect database operations
-        db_points = self._detect_database_operations(file_path, tree, content)
+        # Detect database operations and service communications
+        db_points, service_points = self._detect_call_integrations(file_path, calls)
         points.extend(db_points)
-
-        # Detect service communications
-        service_points = self._detect_service_communications(file_path, tree, content)
         points.extend(service_points)
 
         return points
 
-    def _detect_api_endpoints(self, file_path: Path, tree: ast.AST, content: str) -> List[APIIntegrationPoint]:
-        """Detect API endpoints in the code."""
+    def _detect_api_endpoints(self, file_path: Path, functions: List[ast.FunctionDef]) -> List[APIIntegrationPoint]:
+        """Detect API endpoints among the function definitions in the code."""
         endpoints: List[APIIntegrationPoint] = []
 
-        for node in ast.walk(tree):
+        for node in functions:
             # Look for route decorators
-            if isinstance(node, ast.FunctionDef):
-                for decorator in node.decorator_list:
-                    endpoint = self._analyze_route_decorator(decorator, node, file_path)
-                    if endpoint:
-                        endpoints.append(endpoint)
+            for decorator in node.decorator_list:
+                endpoint = self._analyze_route_decorator(decorator, node, file_path)
+                if endpoint:
+                    endpoints.append(endpoint)
 
         return endpoints
 
@@ -104,17 +108,25 @@ class IntegrationPointDetector:
             auth_required=auth_required
         )
 
-    def _detect_database_operations(self, file_path: Path, tree: ast.AST, content: str) -> List[DatabaseIntegrationPoint]:
-        """Detect database operations in the code."""
+    def _detect_call_integrations(
+        self,
+        file_path: Path,
+        calls: List[ast.Call]
+    ) -> Tuple[List[DatabaseIntegrationPoint], List[ServiceIntegrationPoint]]:
+        """Detect database operations and service communications among the calls in the code."""
         operations: List[DatabaseIntegrationPoint] = []
+        communications: List[ServiceIntegrationPoint] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                db_op = self._analyze_database_call(node, file_path)
-                if db_op:
-                    operations.append(db_op)
+        for node in calls:
+            db_op = self._analyze_database_call(node, file_path)
+            if db_op:
+                operations.append(db_op)
+
+            service_comm = self._analyze_service_call(node, file_path)
+            if service_comm:
+                communications.append(service_comm)
 
-        return operations
+        return operations, communications
 
     def _analyze_database_call(self, node: ast.Call, file_path: Path) -> Optional[DatabaseIntegrationPoint]:
         """Analyze a potential database operation call."""
@@ -151,18 +163,6 @@ class IntegrationPointDetector:
 
         return None
 
-    def _detect_service_communications(self, file_path: Path, tree: ast.AST, content: str) -> List[ServiceIntegrationPoint]:
-        """Detect service-to-service communications in the code."""
-        communications: List[ServiceIntegrationPoint] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                service_comm = self._analyze_service_call(node, file_path)
-                if service_comm:
-                    communications.append(service_comm)
-
-        return communications
-
     def _analyze_service_call(self, node: ast.Call, file_path: Path) -> Optional[ServiceIntegrationPoint]:
         """Analyze a potential service communication call."""
         if not hasattr(node.func, "attr"):
@@ -58,11 +58,17 @@ class Component:
         return self.metadata.get(key)
 
     def __hash__(self) -> int:
-        """Make Component hashable using its ID."""
-        return hash(self.id)
+        """Make Component hashable using its ID.
+
+        Hashes the UUID's integer directly, which gives the same value as
+        hash(self.id) without going through UUID.__hash__.
+        """
+        return hash(self.id.int)
 
     def __eq__(self, other: object) -> bool:
         """Compare components using their IDs."""
+        if self is other:
+            return True
         if not isinstance(other, Component):
             return NotImplemented
-        return self.id == other.id
+        return self.id.int == other.id.int
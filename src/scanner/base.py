@@ -1,16 +1,34 @@
 """Base classes for repository scanning functionality."""
 
+import asyncio
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Set, Union
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, List, Optional, Set, Tuple, Union
 
+from src.scanner.dependencies import DependencyGraph
 from src.utils.file_utils import filter_files
 from src.utils.logging import logger
 from src.utils.validation_utils import validate_path
 
 
+# File path, parse result (None on failure) and error message of one parsed file
+ParseOutcome = Tuple[Path, Any, Optional[str]]
+
+
 class BaseScanner(ABC):
-    """Abstract base class for repository scanners."""
+    """Abstract base class for repository scanners.
+
+    Scanners that support batch scanning implement `_file_parser` and
+    `_record_file`: files are parsed by the former in worker processes and
+    the results are recorded by the latter on the calling process.
+    """
+
+    # Graph that scanners building one finalize once a scan completes
+    _dependency_graph: Optional[DependencyGraph] = None
 
     def __init__(
         self,
@@ -90,7 +108,11 @@ class BaseScanner(ABC):
         pass
 
     def scan(self) -> None:
-        """Scan all matching files in the repository."""
+        """Scan all matching files in the repository.
+
+        Like the batch scans, a completed scan finalizes the dependency
+        graph, so components are iterated in topological order.
+        """
         logger.info(f"Starting scan of {self.root_path}")
 
         for file in self.get_files():
@@ -101,6 +123,111 @@ class BaseScanner(ABC):
                 logger.error(f"Error scanning {file}: {str(e)}")
                 self._errors[file] = str(e)
 
+        self._finish_scan()
+
+    def scan_files(
+        self,
+        file_paths: Iterable[Path],
+        num_processors: Optional[int] = None
+    ) -> None:
+        """Scan multiple files, parsing them in parallel worker processes.
+
+        Parsing runs in a process pool; the extracted information is merged
+        into the scanner state on the calling process, so graph mutation
+        stays single-threaded.
+
+        Args:
+            file_paths: Paths to the files to scan
+            num_processors: Number of worker processes (default: CPU count)
+        """
+        file_paths = [path for path in file_paths if path not in self._scanned_files]
+        num_processors = num_processors or os.cpu_count() or 1
+        parse = partial(_parse_one, self._file_parser())
+
+        if num_processors <= 1 or len(file_paths) <= 1:
+            self._merge_parse_results(map(parse, file_paths))
+        else:
+            with ProcessPoolExecutor(max_workers=num_processors) as executor:
+                self._merge_parse_results(executor.map(parse, file_paths, chunksize=16))
+
+        self._finish_scan()
+
+    async def scan_files_async(
+        self,
+        file_paths: Iterable[Path],
+        num_processors: Optional[int] = None
+    ) -> None:
+        """Scan multiple files from within a running event loop.
+
+        Files are read and parsed in a process pool with at most twice
+        `num_processors` files in flight. Paths are consumed lazily and
+        results are merged on the event loop thread in input order as soon
+        as they are ready, so memory stays flat in the number of files and
+        merging overlaps with reading and parsing of later files.
+
+        Args:
+            file_paths: Paths to the files to scan
+            num_processors: Number of worker processes (default: CPU count)
+        """
+        num_processors = num_processors or os.cpu_count() or 1
+        parse = partial(_parse_one, self._file_parser())
+        loop = asyncio.get_running_loop()
+        window = num_processors * 2
+        pending: Deque[asyncio.Future] = deque()
+
+        with ProcessPoolExecutor(max_workers=num_processors) as executor:
+            try:
+                for path in file_paths:
+                    if path in self._scanned_files:
+                        continue
+                    pending.append(loop.run_in_executor(executor, parse, path))
+                    if len(pending) >= window:
+                        self._merge_parse_results([await pending.popleft()])
+
+                while pending:
+                    self._merge_parse_results([await pending.popleft()])
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        self._finish_scan()
+
+    def _file_parser(self) -> Callable[[Path], Any]:
+        """Return the function parsing one file for batch scanning.
+
+        The function runs in worker processes, so it must be picklable,
+        e.g. a module-level function or a `functools.partial` of one.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch scanning")
+
+    def _record_file(self, file_path: Path, parsed: Any) -> None:
+        """Store the information parsed from a file by `_file_parser`.
+
+        Args:
+            file_path: Path to the parsed file
+            parsed: Result returned by the file parser
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch scanning")
+
+    def _merge_parse_results(self, results: Iterable[ParseOutcome]) -> None:
+        """Merge parse results from `_parse_one` into the scanner state."""
+        for file_path, parsed, error in results:
+            if error is not None:
+                logger.error(f"Error scanning {file_path}: {error}")
+                self._errors[file_path] = error
+                continue
+
+            try:
+                self._record_file(file_path, parsed)
+                self._scanned_files.add(file_path)
+            except Exception as e:
+                logger.error(f"Error scanning {file_path}: {str(e)}")
+                self._errors[file_path] = str(e)
+
+    def _finish_scan(self) -> None:
+        """Finalize the dependency graph, if any, and log a scan summary."""
+        if self._dependency_graph is not None:
+            self._dependency_graph.finalize()
         logger.info(
             f"Scan completed. Processed {len(self._scanned_files)} files. "
             f"Encountered {len(self._errors)} errors."
@@ -122,3 +249,23 @@ class BaseScanner(ABC):
             Set of Path objects for scanned files
         """
         return self._scanned_files.copy()
+
+
+def _parse_one(parse: Callable[[Path], Any], file_path: Path) -> ParseOutcome:
+    """Parse a single file in a worker process.
+
+    Defined at module level so it can be pickled by `ProcessPoolExecutor`.
+    Errors are returned rather than raised so one bad file does not abort
+    the remaining work in the pool.
+
+    Args:
+        parse: Scanner-specific function parsing one file
+        file_path: Path to the file to parse
+
+    Returns:
+        Tuple of file path, parse result (None on failure) and error message
+    """
+    try:
+        return file_path, parse(file_path), None
+    except Exception as e:
+        return file_path, None, str(e)
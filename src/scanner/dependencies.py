@@ -1,11 +1,21 @@
 """Component dependency analysis functionality."""
 
+import sys
+import warnings
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Final, Iterable, List, Optional, Set, Tuple, Union
 
+# dataclass(slots=True) is only available from Python 3.10; shared by the scanners
+_SLOTS: Final = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# (source_file, source_component, target_file, target_component, dependency_type, line_number)
+EdgeTuple = Tuple[Path, str, Optional[Path], str, str, int]
+
+
+@dataclass(frozen=True, **_SLOTS)
 class DependencyInfo:
     """Information about a dependency between components."""
     source_file: Path
@@ -16,27 +26,83 @@ class DependencyInfo:
     line_number: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ComponentInfo:
-    """Information about a component and its dependencies."""
+    """Information about a component and its dependencies.
+
+    Dependencies are stored by the `DependencyGraph` the component was last
+    added to; the `dependencies` and `dependents` properties are deprecated
+    views of that graph's edges.
+    """
     name: str
     file_path: Path
     component_type: str  # 'class', 'function', 'module'
-    dependencies: Set[DependencyInfo] = field(default_factory=set)
-    dependents: Set[DependencyInfo] = field(default_factory=set)
     framework_type: Optional[str] = None  # 'flask', 'django', 'fastapi', etc.
     is_integration_point: bool = False
     metadata: Dict[str, str] = field(default_factory=dict)
+    _graph: Optional["DependencyGraph"] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def dependencies(self) -> Set[DependencyInfo]:
+        """Get the component's dependencies (deprecated).
+
+        Use `DependencyGraph.get_dependencies` instead.
+        """
+        warnings.warn(
+            "ComponentInfo.dependencies is deprecated; use DependencyGraph.get_dependencies",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return self._graph.get_dependencies(self.name) if self._graph is not None else set()
+
+    @property
+    def dependents(self) -> Set[DependencyInfo]:
+        """Get the dependencies on the component (deprecated).
+
+        Use `DependencyGraph.get_dependents` instead.
+        """
+        warnings.warn(
+            "ComponentInfo.dependents is deprecated; use DependencyGraph.get_dependents",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return self._graph.get_dependents(self.name) if self._graph is not None else set()
 
 
 class DependencyGraph:
-    """Graph representation of component dependencies."""
+    """Graph representation of component dependencies.
+
+    Edges are stored column-wise: parallel arrays of interned component
+    and dependency-type ids, line numbers and file paths, indexed by edge
+    id. `DependencyInfo` objects are only built when edges are queried.
+    """
 
     def __init__(self):
         """Initialize the dependency graph."""
         self._components: Dict[str, ComponentInfo] = {}
         self._file_components: Dict[Path, Set[str]] = {}
 
+        # Interned names and dependency types
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._types: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+
+        # Edge columns
+        self._edge_source = array("i")
+        self._edge_target = array("i")
+        self._edge_type = array("i")
+        self._edge_line = array("i")
+        self._edge_source_file: List[Path] = []
+        self._edge_target_file: List[Optional[Path]] = []
+
+        # Component name id -> outgoing/incoming edge ids
+        self._out_edges: Dict[int, List[int]] = {}
+        self._in_edges: Dict[int, List[int]] = {}
+
+        # (source id, target id, type id, line number) -> edge id
+        self._edge_by_key: Dict[Tuple[int, int, int, int], int] = {}
+
     def add_component(self, component: ComponentInfo) -> None:
         """Add a component to the graph.
 
@@ -44,6 +110,14 @@ class DependencyGraph:
             component: Component information
         """
         self._components[component.name] = component
+        component._graph = self
+
+        # A replaced component starts without edges
+        name_id = self._name_ids.get(component.name)
+        if name_id is not None:
+            self._out_edges.pop(name_id, None)
+            self._in_edges.pop(name_id, None)
+
         if component.file_path not in self._file_components:
             self._file_components[component.file_path] = set()
         self._file_components[component.file_path].add(component.name)
@@ -54,11 +128,160 @@ class DependencyGraph:
         Args:
             dependency: Dependency information
         """
-        if dependency.source_component in self._components:
-            self._components[dependency.source_component].dependencies.add(dependency)
+        self.add_edge(
+            dependency.source_file,
+            dependency.source_component,
+            dependency.target_file,
+            dependency.target_component,
+            dependency.dependency_type,
+            dependency.line_number
+        )
+
+    def add_edge(
+        self,
+        source_file: Path,
+        source_component: str,
+        target_file: Optional[Path],
+        target_component: str,
+        dependency_type: str,
+        line_number: int
+    ) -> None:
+        """Add a dependency between components without building a `DependencyInfo`.
+
+        The edge is attached to the source and target components that are
+        already in the graph. An edge with the same source, target, type and
+        line as an existing one is not stored again.
 
-        if dependency.target_component in self._components:
-            self._components[dependency.target_component].dependents.add(dependency)
+        Args:
+            source_file: File containing the source component
+            source_component: Name of the dependent component
+            target_file: File containing the target component, if known
+            target_component: Name of the component depended upon
+            dependency_type: Kind of dependency ('import', 'inherits', etc.)
+            line_number: Line on which the dependency occurs
+        """
+        source_id = self._intern_name(source_component)
+        target_id = self._intern_name(target_component)
+        type_id = self._type_ids.get(dependency_type)
+        if type_id is None:
+            type_id = self._type_ids[dependency_type] = len(self._types)
+            self._types.append(dependency_type)
+
+        attach_source = source_component in self._components
+        attach_target = target_component in self._components
+
+        key = (source_id, target_id, type_id, line_number)
+        edge_id = self._edge_by_key.get(key)
+        if edge_id is None:
+            edge_id = self._edge_by_key[key] = len(self._edge_line)
+            self._edge_source.append(source_id)
+            self._edge_target.append(target_id)
+            self._edge_type.append(type_id)
+            self._edge_line.append(line_number)
+            self._edge_source_file.append(source_file)
+            self._edge_target_file.append(target_file)
+        else:
+            # A known edge is only attached where it is missing, e.g. to a
+            # component added or replaced since the edge was first seen
+            attach_source = attach_source and edge_id not in self._out_edges.get(source_id, ())
+            attach_target = attach_target and edge_id not in self._in_edges.get(target_id, ())
+
+        if attach_source:
+            self._out_edges.setdefault(source_id, []).append(edge_id)
+
+        if attach_target:
+            self._in_edges.setdefault(target_id, []).append(edge_id)
+
+    def add_batch(
+        self,
+        components: Iterable[ComponentInfo],
+        edges: Iterable[EdgeTuple]
+    ) -> None:
+        """Add several components, then the dependencies between them.
+
+        Edges are added in the given order after all components, so they can
+        attach to any component in the batch. Duplicate edges are added once.
+
+        Args:
+            components: Components to add
+            edges: Edges in the same field order as `add_edge` arguments
+        """
+        for component in components:
+            self.add_component(component)
+
+        add_edge = self.add_edge
+        for edge in edges:
+            add_edge(*edge)
+
+    def _intern_name(self, name: str) -> int:
+        """Return the integer id for a component name, assigning one if needed."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def _edge_info(self, edge_id: int) -> DependencyInfo:
+        """Build a `DependencyInfo` view of a stored edge."""
+        return DependencyInfo(
+            source_file=self._edge_source_file[edge_id],
+            source_component=self._names[self._edge_source[edge_id]],
+            target_file=self._edge_target_file[edge_id],
+            target_component=self._names[self._edge_target[edge_id]],
+            dependency_type=self._types[self._edge_type[edge_id]],
+            line_number=self._edge_line[edge_id]
+        )
+
+    def _edge_ids(self, edges: Dict[int, List[int]], component_name: str) -> List[int]:
+        """Get the edge ids recorded for a component in an adjacency map."""
+        name_id = self._name_ids.get(component_name)
+        if name_id is None:
+            return []
+        return edges.get(name_id, [])
+
+    def finalize(self) -> List[ComponentInfo]:
+        """Reorder components topologically once all files have been added.
+
+        Components are re-inserted so each one precedes the components it
+        depends on, and later iteration over the graph follows that order.
+        Components on cycles keep their insertion order after the rest.
+
+        Returns:
+            Components in topological order
+        """
+        names = list(self._components)
+        in_degree = dict.fromkeys(names, 0)
+        successors: Dict[str, List[str]] = {}
+        for name in names:
+            targets = [
+                target
+                for target in (
+                    self._names[self._edge_target[edge_id]]
+                    for edge_id in self._edge_ids(self._out_edges, name)
+                )
+                if target in in_degree
+            ]
+            successors[name] = targets
+            for target in targets:
+                in_degree[target] += 1
+
+        # Kahn's algorithm
+        queue = deque(name for name in names if in_degree[name] == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for target in successors[name]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+
+        if len(order) < len(names):
+            placed = set(order)
+            order.extend(name for name in names if name not in placed)
+
+        self._components = {name: self._components[name] for name in order}
+        return list(self._components.values())
 
     def get_component(self, name: str) -> Optional[ComponentInfo]:
         """Get component information by name.
@@ -91,8 +314,10 @@ class DependencyGraph:
         Returns:
             Set of dependencies
         """
-        component = self._components.get(component_name)
-        return component.dependencies if component else set()
+        return {
+            self._edge_info(edge_id)
+            for edge_id in self._edge_ids(self._out_edges, component_name)
+        }
 
     def get_dependents(self, component_name: str) -> Set[DependencyInfo]:
         """Get all components that depend on this component.
@@ -103,8 +328,10 @@ class DependencyGraph:
         Returns:
             Set of dependencies
         """
-        component = self._components.get(component_name)
-        return component.dependents if component else set()
+        return {
+            self._edge_info(edge_id)
+            for edge_id in self._edge_ids(self._in_edges, component_name)
+        }
 
     def get_integration_points(self) -> List[ComponentInfo]:
         """Get all components marked as integration points.
@@ -153,8 +380,8 @@ class DependencyGraph:
             visited.add(component)
             path.append(component)
 
-            for dep in self.get_dependencies(component):
-                dfs(dep.target_component)
+            for edge_id in self._edge_ids(self._out_edges, component):
+                dfs(self._names[self._edge_target[edge_id]])
 
             path.pop()
 
@@ -181,8 +408,8 @@ class DependencyGraph:
         score = 1
 
         # Add points for each dependency and dependent
-        score += len(component.dependencies)
-        score += len(component.dependents)
+        score += len(self._edge_ids(self._out_edges, component_name))
+        score += len(self._edge_ids(self._in_edges, component_name))
 
         # Extra points for being an integration point
         if component.is_integration_point:
@@ -224,11 +451,11 @@ class DependencyGraph:
                     "is_integration_point": comp.is_integration_point,
                     "dependencies": [
                         {
-                            "target": dep.target_component,
-                            "type": dep.dependency_type,
-                            "line": dep.line_number
+                            "target": self._names[self._edge_target[edge_id]],
+                            "type": self._types[self._edge_type[edge_id]],
+                            "line": self._edge_line[edge_id]
                         }
-                        for dep in comp.dependencies
+                        for edge_id in self._edge_ids(self._out_edges, name)
                     ],
                     "metadata": comp.metadata
                 }
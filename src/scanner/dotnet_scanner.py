@@ -3,14 +3,27 @@
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Callable, ClassVar, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 from src.scanner.base import BaseScanner
-from src.scanner.dependencies import ComponentInfo, DependencyGraph, DependencyInfo
+from src.scanner.dependencies import _SLOTS, ComponentInfo, DependencyGraph, DependencyInfo
 from src.utils.logging import logger
 
 
-@dataclass
+# Common C# patterns, compiled once at import
+_PATTERNS: Dict[str, Pattern[str]] = {
+    "namespace": re.compile(r"namespace\s+([.\w]+)\s*{?"),
+    "using": re.compile(r"using\s+(static\s+)?([.\w]+)(\s+as\s+(\w+))?\s*;"),
+    "class": re.compile(r"(?:public|internal|private|protected|static|sealed|abstract)*\s+class\s+(\w+)"),
+    "inheritance": re.compile(r":\s*([\w.,\s]+)"),
+    "method": re.compile(r"(?:public|private|protected|internal|static|virtual|override|abstract)*\s+(?:async\s+)?[\w<>[\]]+\s+(\w+)\s*\([^)]*\)"),
+    "property": re.compile(r"(?:public|private|protected|internal|static|virtual|override)*\s+[\w<>[\]]+\s+(\w+)\s*{\s*get\s*;\s*(?:set\s*;)?}"),
+    "attribute": re.compile(r"\[([^\]]+)\]"),
+    "doc_comment": re.compile(r"///.*")
+}
+
+
+@dataclass(**_SLOTS)
 class UsingInfo:
     """Information about a using directive."""
     namespace: str
@@ -19,7 +32,7 @@ class UsingInfo:
     line_number: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PropertyInfo:
     """Information about a property definition."""
     name: str
@@ -29,7 +42,7 @@ class PropertyInfo:
     line_number: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MethodInfo:
     """Information about a method definition."""
     name: str
@@ -42,7 +55,7 @@ class MethodInfo:
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClassInfo:
     """Information about a class definition."""
     name: str
@@ -55,9 +68,15 @@ class ClassInfo:
     docstring: Optional[str] = None
 
 
+# Namespace, using directives and classes extracted from one file
+ParseResult = Tuple[str, List[UsingInfo], List[ClassInfo]]
+
+
 class DotNetScanner(BaseScanner):
     """Scanner for .NET/C# source code files."""
 
+    _patterns: ClassVar[Dict[str, Pattern[str]]] = _PATTERNS
+
     def __init__(self, *args, **kwargs):
         """Initialize the .NET scanner."""
         super().__init__(*args, **kwargs)
@@ -65,18 +84,6 @@ class DotNetScanner(BaseScanner):
         self._classes: Dict[Path, List[ClassInfo]] = {}
         self._dependency_graph = DependencyGraph()
 
-        # Common C# patterns
-        self._patterns = {
-            "namespace": re.compile(r"namespace\s+([.\w]+)\s*{?"),
-            "using": re.compile(r"using\s+(static\s+)?([.\w]+)(\s+as\s+(\w+))?\s*;"),
-            "class": re.compile(r"(?:public|internal|private|protected|static|sealed|abstract)*\s+class\s+(\w+)"),
-            "inheritance": re.compile(r":\s*([\w.,\s]+)"),
-            "method": re.compile(r"(?:public|private|protected|internal|static|virtual|override|abstract)*\s+(?:async\s+)?[\w<>[\]]+\s+(\w+)\s*\([^)]*\)"),
-            "property": re.compile(r"(?:public|private|protected|internal|static|virtual|override)*\s+[\w<>[\]]+\s+(\w+)\s*{\s*get\s*;\s*(?:set\s*;)?}"),
-            "attribute": re.compile(r"\[([^\]]+)\]"),
-            "doc_comment": re.compile(r"///.*")
-        }
-
     def _default_include_patterns(self) -> List[str]:
         """Return default glob patterns for C# files."""
         return ["**/*.cs"]
@@ -96,45 +103,52 @@ class DotNetScanner(BaseScanner):
     def scan_file(self, file_path: Path) -> None:
         """Scan a C# file and extract information."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract file components
-            namespace = self._extract_namespace(content)
-            usings = self._extract_usings(content)
-            classes = self._extract_classes(content, namespace)
-
-            # Store extracted information
-            if usings:
-                self._usings[file_path] = usings
-            if classes:
-                self._classes[file_path] = classes
-
-            # Add components to dependency graph
-            self._add_file_components(file_path, namespace, usings, classes)
-
+            self._record_file(file_path, _parse_file(file_path))
         except Exception as e:
             logger.error(f"Error parsing {file_path}: {str(e)}")
             raise
 
-    def _extract_namespace(self, content: str) -> str:
+    def _file_parser(self) -> Callable[[Path], ParseResult]:
+        """Return the function parsing one C# file for batch scanning."""
+        return _parse_file
+
+    def _record_file(self, file_path: Path, parsed: ParseResult) -> None:
+        """Store extracted information for a parsed file."""
+        namespace, usings, classes = parsed
+        if usings:
+            self._usings[file_path] = usings
+        if classes:
+            self._classes[file_path] = classes
+
+        # Add components to dependency graph
+        self._add_file_components(file_path, namespace, usings, classes)
+
+    @classmethod
+    def _extract_namespace(cls, content: str) -> str:
         """Extract namespace from file content."""
-        match = self._patterns["namespace"].search(content)
+        match = cls._patterns["namespace"].search(content)
         return match.group(1) if match else ""
 
-    def _extract_usings(self, content: str) -> List[UsingInfo]:
+    @classmethod
+    def _extract_usings(cls, content: str) -> List[UsingInfo]:
         """Extract using directives from file content."""
         usings = []
-        for match in self._patterns["using"].finditer(content):
+        line_number = 1
+        position = 0
+        for match in cls._patterns["using"].finditer(content):
+            # Count newlines only since the previous match
+            line_number += content.count("\n", position, match.start())
+            position = match.start()
             usings.append(UsingInfo(
                 namespace=match.group(2),
                 alias=match.group(4),
                 is_static=bool(match.group(1)),
-                line_number=content.count("\n", 0, match.start()) + 1
+                line_number=line_number
             ))
         return usings
 
-    def _extract_classes(self, content: str, namespace: str) -> List[ClassInfo]:
+    @classmethod
+    def _extract_classes(cls, content: str, namespace: str) -> List[ClassInfo]:
         """Extract class definitions from file content."""
         classes = []
         lines = content.split("\n")
@@ -143,25 +157,25 @@ class DotNetScanner(BaseScanner):
 
         for i, line in enumerate(lines):
             # Track XML documentation
-            doc_match = self._patterns["doc_comment"].match(line.strip())
+            doc_match = cls._patterns["doc_comment"].match(line.strip())
             if doc_match:
                 current_doc.append(doc_match.group(0).strip("/ "))
                 continue
 
             # Look for class definitions
-            class_match = self._patterns["class"].search(line)
+            class_match = cls._patterns["class"].search(line)
             if class_match:
                 # Get class attributes
                 attributes = []
                 j = i - 1
-                while j >= 0 and self._patterns["attribute"].match(lines[j].strip()):
-                    attr_match = self._patterns["attribute"].match(lines[j].strip())
+                while j >= 0 and cls._patterns["attribute"].match(lines[j].strip()):
+                    attr_match = cls._patterns["attribute"].match(lines[j].strip())
                     attributes.insert(0, attr_match.group(1))
                     j -= 1
 
                 # Get base classes
                 bases = []
-                inheritance_match = self._patterns["inheritance"].search(line)
+                inheritance_match = cls._patterns["inheritance"].search(line)
                 if inheritance_match:
                     bases = [b.strip() for b in inheritance_match.group(1).split(",")]
 
@@ -179,13 +193,13 @@ class DotNetScanner(BaseScanner):
 
             # Look for methods in current class
             if current_class:
-                method_match = self._patterns["method"].search(line)
+                method_match = cls._patterns["method"].search(line)
                 if method_match:
                     # Get method attributes
                     attributes = []
                     j = i - 1
-                    while j >= 0 and self._patterns["attribute"].match(lines[j].strip()):
-                        attr_match = self._patterns["attribute"].match(lines[j].strip())
+                    while j >= 0 and cls._patterns["attribute"].match(lines[j].strip()):
+                        attr_match = cls._patterns["attribute"].match(lines[j].strip())
                         attributes.insert(0, attr_match.group(1))
                         j -= 1
 
@@ -211,7 +225,7 @@ class DotNetScanner(BaseScanner):
                     continue
 
                 # Look for properties
-                prop_match = self._patterns["property"].search(line)
+                prop_match = cls._patterns["property"].search(line)
                 if prop_match:
                     access_mods = []
                     for mod in ["public", "private", "protected", "internal", "static", "virtual", "override"]:
@@ -339,3 +353,21 @@ class DotNetScanner(BaseScanner):
     def dependency_graph(self) -> DependencyGraph:
         """Get the dependency graph."""
         return self._dependency_graph
+
+
+def _parse_file(file_path: Path) -> ParseResult:
+    """Read a C# file and extract its namespace, using directives and classes.
+
+    Args:
+        file_path: Path to the C# file to parse
+
+    Returns:
+        Tuple of namespace, using directives and classes
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    namespace = DotNetScanner._extract_namespace(content)
+    usings = DotNetScanner._extract_usings(content)
+    classes = DotNetScanner._extract_classes(content, namespace)
+    return namespace, usings, classes
@@ -1,16 +1,45 @@
 """Python code scanner implementation."""
 
 import ast
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Type, Union
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, Final, List, Mapping, Optional, Pattern, Set, Tuple, Type, Union
 
 from src.scanner.base import BaseScanner
-from src.scanner.dependencies import ComponentInfo, DependencyGraph, DependencyInfo
+from src.scanner.dependencies import _SLOTS, ComponentInfo, DependencyGraph, EdgeTuple
+from src.utils.file_utils import ensure_directory
 from src.utils.logging import logger
 
+__all__ = [
+    "ClassInfo",
+    "FunctionInfo",
+    "ImportInfo",
+    "PythonASTVisitor",
+    "PythonScanner",
+]
 
-@dataclass
+# Bump whenever PythonASTVisitor output changes so stale parse caches are ignored
+_CACHE_VERSION: Final = "4"
+
+# Statement-list fields through which nested imports, functions and classes are reached
+_BLOCK_FIELDS: Final = ("body", "handlers", "orelse", "finalbody", "cases")
+
+# Cheap pre-filter for framework analysis; a superset of the import prefix checks
+_FRAMEWORK_RE: Final[Pattern[bytes]] = re.compile(rb"\b(flask|django|fastapi)")
+
+# Decorator substrings that mark a FastAPI-style endpoint
+_HTTP_METHODS: Final = ("get", "post", "put", "delete")
+
+
+@dataclass(**_SLOTS)
 class ImportInfo:
     """Information about an import statement."""
     module_name: str
@@ -18,9 +47,10 @@ class ImportInfo:
     is_from_import: bool = False
     alias: Optional[str] = None
     line_number: int = 0
+    level: int = 0  # Number of leading dots in a relative import
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionInfo:
     """Information about a function definition."""
     name: str
@@ -30,9 +60,11 @@ class FunctionInfo:
     is_method: bool = False
     line_number: int = 0
     docstring: Optional[str] = None
+    has_route_decorator: bool = False
+    http_method_decorator: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClassInfo:
     """Information about a class definition."""
     name: str
@@ -46,14 +78,21 @@ class ClassInfo:
 class PythonScanner(BaseScanner):
     """Scanner for Python source code files."""
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the Python scanner."""
+    def __init__(self, *args, cache_dir: Optional[Union[str, Path]] = None, **kwargs) -> None:
+        """Initialize the Python scanner.
+
+        Args:
+            cache_dir: Optional directory (e.g. ``.cache/python_scanner``) for
+                caching parse results keyed by file content hash
+        """
         super().__init__(*args, **kwargs)
+        self._cache_dir = ensure_directory(cache_dir) if cache_dir else None
         self._imports: Dict[Path, List[ImportInfo]] = {}
         self._functions: Dict[Path, List[FunctionInfo]] = {}
         self._classes: Dict[Path, List[ClassInfo]] = {}
         self._framework_info: Dict[Path, Dict[str, List[dict]]] = {}
         self._dependency_graph = DependencyGraph()
+        self._name_cache: Dict[Tuple[str, ...], str] = {}
 
     def _default_include_patterns(self) -> List[str]:
         """Return default glob patterns for Python files.
@@ -63,6 +102,14 @@ class PythonScanner(BaseScanner):
         """
         return ["**/*.py"]
 
+    def _default_exclude_patterns(self) -> List[str]:
+        """Return default glob patterns to exclude.
+
+        Returns:
+            List of glob patterns for files to skip
+        """
+        return super()._default_exclude_patterns()
+
     def scan_file(self, file_path: Path) -> None:
         """Scan a Python file and extract information.
 
@@ -70,169 +117,161 @@ class PythonScanner(BaseScanner):
             file_path: Path to the Python file to scan
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            visitor = _parse_file(file_path, self._cache_dir)
+            self._record_file(file_path, visitor)
+        except Exception as e:
+            logger.error(f"Error parsing {file_path}: {str(e)}")
+            raise
 
-            tree = ast.parse(content, filename=str(file_path))
-            visitor = PythonASTVisitor()
-            visitor.visit(tree)
+    def _file_parser(self) -> Callable[[Path], "PythonASTVisitor"]:
+        """Return the function parsing one Python file for batch scanning."""
+        return partial(_parse_file, cache_dir=self._cache_dir)
 
-            # Store extracted information
-            if visitor.imports:
-                self._imports[file_path] = visitor.imports
-            if visitor.functions:
-                self._functions[file_path] = visitor.functions
-            if visitor.classes:
-                self._classes[file_path] = visitor.classes
+    def _record_file(self, file_path: Path, visitor: "PythonASTVisitor") -> None:
+        """Store extracted information for a parsed file.
 
-            # Add components to dependency graph
-            self._add_file_components(file_path, visitor)
+        Args:
+            file_path: Path to the parsed file
+            visitor: AST visitor with extracted information
+        """
+        # Store extracted information
+        if visitor.imports:
+            self._imports[file_path] = visitor.imports
+        if visitor.functions:
+            self._functions[file_path] = visitor.functions
+        if visitor.classes:
+            self._classes[file_path] = visitor.classes
 
-            # Analyze framework-specific patterns
-            self._analyze_frameworks(file_path, tree, visitor)
+        # Add components to dependency graph
+        self._add_file_components(file_path, visitor)
 
-        except Exception as e:
-            logger.error(f"Error parsing {file_path}: {str(e)}")
-            raise
+        # Analyze framework-specific patterns
+        self._analyze_frameworks(file_path, visitor)
 
     def _add_file_components(self, file_path: Path, visitor: "PythonASTVisitor") -> None:
-        """Add file components to the dependency graph."""
-        # Add module as a component
-        module_name = file_path.stem
-        module_component = ComponentInfo(
+        """Add file components to the dependency graph.
+
+        All components of the file are added before any edge, and edges are
+        emitted grouped by source component so each component's outgoing
+        edges are stored contiguously.
+        """
+        module_name = self._qname(file_path.stem)
+
+        # First pass: collect components and their edges
+        components = [ComponentInfo(
             name=module_name,
             file_path=file_path,
             component_type="module"
-        )
-        self._dependency_graph.add_component(module_component)
+        )]
+        module_edges: List[EdgeTuple] = []
+        class_edges: List[EdgeTuple] = []
 
-        # Add functions as components
+        # Functions, contained by the module
         for func in visitor.functions:
-            func_component = ComponentInfo(
-                name=f"{module_name}.{func.name}",
+            func_name = self._qname(module_name, func.name)
+            components.append(ComponentInfo(
+                name=func_name,
                 file_path=file_path,
                 component_type="function",
-                is_integration_point=any("route" in d for d in func.decorators)
-            )
-            self._dependency_graph.add_component(func_component)
-
-            # Add dependency from module to function
-            self._dependency_graph.add_dependency(DependencyInfo(
-                source_file=file_path,
-                source_component=module_name,
-                target_file=file_path,
-                target_component=func_component.name,
-                dependency_type="contains",
-                line_number=func.line_number
+                is_integration_point=func.has_route_decorator
             ))
+            module_edges.append(
+                (file_path, module_name, file_path, func_name, "contains", func.line_number)
+            )
 
-        # Add classes as components
+        # Classes, contained by the module, with their bases and methods
         for cls in visitor.classes:
-            cls_component = ComponentInfo(
-                name=f"{module_name}.{cls.name}",
+            cls_name = self._qname(module_name, cls.name)
+            components.append(ComponentInfo(
+                name=cls_name,
                 file_path=file_path,
                 component_type="class",
                 is_integration_point=any(base.endswith("View") for base in cls.bases)
-            )
-            self._dependency_graph.add_component(cls_component)
-
-            # Add dependency from module to class
-            self._dependency_graph.add_dependency(DependencyInfo(
-                source_file=file_path,
-                source_component=module_name,
-                target_file=file_path,
-                target_component=cls_component.name,
-                dependency_type="contains",
-                line_number=cls.line_number
             ))
+            module_edges.append(
+                (file_path, module_name, file_path, cls_name, "contains", cls.line_number)
+            )
 
-            # Add inheritance dependencies
+            # Bases may be in another file
             for base in cls.bases:
-                self._dependency_graph.add_dependency(DependencyInfo(
-                    source_file=file_path,
-                    source_component=cls_component.name,
-                    target_file=None,  # May be in another file
-                    target_component=base,
-                    dependency_type="inherits",
-                    line_number=cls.line_number
-                ))
+                class_edges.append(
+                    (file_path, cls_name, None, base, "inherits", cls.line_number)
+                )
 
-            # Add method components
             for method_name, method in cls.methods.items():
-                method_component = ComponentInfo(
-                    name=f"{module_name}.{cls.name}.{method_name}",
+                method_full_name = self._qname(module_name, cls.name, method_name)
+                components.append(ComponentInfo(
+                    name=method_full_name,
                     file_path=file_path,
                     component_type="method",
-                    is_integration_point=any("route" in d for d in method.decorators)
-                )
-                self._dependency_graph.add_component(method_component)
-
-                # Add dependency from class to method
-                self._dependency_graph.add_dependency(DependencyInfo(
-                    source_file=file_path,
-                    source_component=cls_component.name,
-                    target_file=file_path,
-                    target_component=method_component.name,
-                    dependency_type="contains",
-                    line_number=method.line_number
+                    is_integration_point=method.has_route_decorator
+                ))
+                class_edges.append((
+                    file_path, cls_name, file_path, method_full_name, "contains",
+                    method.line_number
                 ))
 
-        # Add import dependencies
+        # Import dependencies, one edge per imported target at its first import
+        imported: Set[str] = set()
         for imp in visitor.imports:
             if imp.is_from_import:
                 # From imports create dependencies to specific components
-                for name in imp.imported_names:
-                    self._dependency_graph.add_dependency(DependencyInfo(
-                        source_file=file_path,
-                        source_component=module_name,
-                        target_file=None,
-                        target_component=f"{imp.module_name}.{name}",
-                        dependency_type="import",
-                        line_number=imp.line_number
-                    ))
+                targets = [self._qname(imp.module_name, name) for name in imp.imported_names]
             else:
                 # Regular imports create dependencies to modules
-                self._dependency_graph.add_dependency(DependencyInfo(
-                    source_file=file_path,
-                    source_component=module_name,
-                    target_file=None,
-                    target_component=imp.module_name,
-                    dependency_type="import",
-                    line_number=imp.line_number
-                ))
-
-    def _analyze_frameworks(
-        self,
-        file_path: Path,
-        tree: ast.AST,
-        visitor: "PythonASTVisitor"
-    ) -> None:
+                targets = [imp.module_name]
+
+            for target in targets:
+                if target not in imported:
+                    imported.add(target)
+                    module_edges.append(
+                        (file_path, module_name, None, target, "import", imp.line_number)
+                    )
+
+        # Second pass: add components, then edges grouped by source
+        self._dependency_graph.add_batch(components, module_edges + class_edges)
+
+    def _qname(self, *parts: str) -> str:
+        """Get the interned dotted component name for the given parts."""
+        name = self._name_cache.get(parts)
+        if name is None:
+            name = self._name_cache[parts] = sys.intern(".".join(parts))
+        return name
+
+    def _analyze_frameworks(self, file_path: Path, visitor: "PythonASTVisitor") -> None:
         """Analyze framework-specific patterns in the code.
 
         Args:
             file_path: Path to the file being analyzed
-            tree: AST of the file
             visitor: AST visitor with extracted information
         """
+        hints = visitor.framework_hints
+        if not hints:
+            return
+
+        frameworks = self._framework_imports(visitor.imports, hints)
+        if not frameworks:
+            return
+
         framework_info = {}
 
         # Flask patterns
-        if self._has_flask_imports(visitor.imports):
-            flask_info = self._analyze_flask_patterns(tree, visitor)
+        if "flask" in frameworks:
+            flask_info = self._analyze_flask_patterns(visitor)
             if flask_info:
                 framework_info["flask"] = flask_info
                 self._update_framework_components(file_path, "flask", flask_info)
 
         # Django patterns
-        if self._has_django_imports(visitor.imports):
-            django_info = self._analyze_django_patterns(tree, visitor)
+        if "django" in frameworks:
+            django_info = self._analyze_django_patterns(visitor)
             if django_info:
                 framework_info["django"] = django_info
                 self._update_framework_components(file_path, "django", django_info)
 
         # FastAPI patterns
-        if self._has_fastapi_imports(visitor.imports):
-            fastapi_info = self._analyze_fastapi_patterns(tree, visitor)
+        if "fastapi" in frameworks:
+            fastapi_info = self._analyze_fastapi_patterns(visitor)
             if fastapi_info:
                 framework_info["fastapi"] = fastapi_info
                 self._update_framework_components(file_path, "fastapi", fastapi_info)
@@ -253,9 +292,9 @@ class PythonScanner(BaseScanner):
             component_name = None
 
             if info["type"] == "route" or info["type"] == "endpoint":
-                component_name = f"{module_name}.{info['function']}"
+                component_name = self._qname(module_name, info["function"])
             elif info["type"] == "view":
-                component_name = f"{module_name}.{info['class']}"
+                component_name = self._qname(module_name, info["class"])
 
             if component_name:
                 component = self._dependency_graph.get_component(component_name)
@@ -263,27 +302,29 @@ class PythonScanner(BaseScanner):
                     component.framework_type = framework
                     component.is_integration_point = True
 
-    def _has_flask_imports(self, imports: List[ImportInfo]) -> bool:
-        """Check if file has Flask imports."""
-        return any(imp.module_name.startswith("flask") for imp in imports)
-
-    def _has_django_imports(self, imports: List[ImportInfo]) -> bool:
-        """Check if file has Django imports."""
-        return any(imp.module_name.startswith("django") for imp in imports)
+    def _framework_imports(self, imports: List[ImportInfo], candidates: Set[str]) -> Set[str]:
+        """Find which candidate frameworks a file imports, in one pass over its imports.
 
-    def _has_fastapi_imports(self, imports: List[ImportInfo]) -> bool:
-        """Check if file has FastAPI imports."""
-        return any(imp.module_name.startswith("fastapi") for imp in imports)
+        Args:
+            imports: Imports of the file
+            candidates: Framework names to look for, e.g. {"flask", "django"}
 
-    def _analyze_flask_patterns(
-        self,
-        tree: ast.AST,
-        visitor: "PythonASTVisitor"
-    ) -> List[dict]:
+        Returns:
+            Candidate frameworks with at least one import
+        """
+        found: Set[str] = set()
+        for imp in imports:
+            for framework in candidates:
+                if framework not in found and imp.module_name.startswith(framework):
+                    found.add(framework)
+            if len(found) == len(candidates):
+                break
+        return found
+
+    def _analyze_flask_patterns(self, visitor: "PythonASTVisitor") -> List[dict]:
         """Analyze Flask-specific patterns.
 
         Args:
-            tree: AST of the file
             visitor: AST visitor with extracted information
 
         Returns:
@@ -293,8 +334,8 @@ class PythonScanner(BaseScanner):
 
         # Look for route decorators
         for func in visitor.functions:
-            route_decorators = [d for d in func.decorators if "route" in d]
-            if route_decorators:
+            if func.has_route_decorator:
+                route_decorators = [d for d in func.decorators if "route" in d]
                 patterns.append({
                     "type": "route",
                     "function": func.name,
@@ -305,15 +346,10 @@ class PythonScanner(BaseScanner):
 
         return patterns
 
-    def _analyze_django_patterns(
-        self,
-        tree: ast.AST,
-        visitor: "PythonASTVisitor"
-    ) -> List[dict]:
+    def _analyze_django_patterns(self, visitor: "PythonASTVisitor") -> List[dict]:
         """Analyze Django-specific patterns.
 
         Args:
-            tree: AST of the file
             visitor: AST visitor with extracted information
 
         Returns:
@@ -334,15 +370,10 @@ class PythonScanner(BaseScanner):
 
         return patterns
 
-    def _analyze_fastapi_patterns(
-        self,
-        tree: ast.AST,
-        visitor: "PythonASTVisitor"
-    ) -> List[dict]:
+    def _analyze_fastapi_patterns(self, visitor: "PythonASTVisitor") -> List[dict]:
         """Analyze FastAPI-specific patterns.
 
         Args:
-            tree: AST of the file
             visitor: AST visitor with extracted information
 
         Returns:
@@ -352,11 +383,11 @@ class PythonScanner(BaseScanner):
 
         # Look for endpoint decorators
         for func in visitor.functions:
-            endpoint_decorators = [
-                d for d in func.decorators
-                if any(method in d.lower() for method in ["get", "post", "put", "delete"])
-            ]
-            if endpoint_decorators:
+            if func.http_method_decorator:
+                endpoint_decorators = [
+                    d for d in func.decorators
+                    if any(method in d.lower() for method in _HTTP_METHODS)
+                ]
                 patterns.append({
                     "type": "endpoint",
                     "function": func.name,
@@ -368,40 +399,57 @@ class PythonScanner(BaseScanner):
         return patterns
 
     @property
-    def imports(self) -> Dict[Path, List[ImportInfo]]:
+    def imports(self) -> Mapping[Path, List[ImportInfo]]:
         """Get all discovered imports.
 
         Returns:
-            Dictionary mapping file paths to lists of imports
+            Read-only view mapping file paths to lists of imports
         """
-        return self._imports.copy()
+        return MappingProxyType(self._imports)
 
     @property
-    def functions(self) -> Dict[Path, List[FunctionInfo]]:
+    def functions(self) -> Mapping[Path, List[FunctionInfo]]:
         """Get all discovered functions.
 
         Returns:
-            Dictionary mapping file paths to lists of functions
+            Read-only view mapping file paths to lists of functions
         """
-        return self._functions.copy()
+        return MappingProxyType(self._functions)
 
     @property
-    def classes(self) -> Dict[Path, List[ClassInfo]]:
+    def classes(self) -> Mapping[Path, List[ClassInfo]]:
         """Get all discovered classes.
 
         Returns:
-            Dictionary mapping file paths to lists of classes
+            Read-only view mapping file paths to lists of classes
         """
-        return self._classes.copy()
+        return MappingProxyType(self._classes)
 
     @property
-    def framework_info(self) -> Dict[Path, Dict[str, List[dict]]]:
+    def framework_info(self) -> Mapping[Path, Dict[str, List[dict]]]:
         """Get all discovered framework-specific patterns.
 
         Returns:
-            Dictionary mapping file paths to framework information
+            Read-only view mapping file paths to framework information
         """
-        return self._framework_info.copy()
+        return MappingProxyType(self._framework_info)
+
+    def snapshot(self) -> Dict[str, Dict[Path, Any]]:
+        """Get copies of the scan results that are safe to mutate.
+
+        The `imports`, `functions`, `classes` and `framework_info` properties
+        return read-only views that reflect later scans; use this when an
+        independent copy is needed.
+
+        Returns:
+            Dictionary mapping result names to shallow copies of each mapping
+        """
+        return {
+            "imports": self._imports.copy(),
+            "functions": self._functions.copy(),
+            "classes": self._classes.copy(),
+            "framework_info": self._framework_info.copy()
+        }
 
     @property
     def dependency_graph(self) -> DependencyGraph:
@@ -413,14 +461,111 @@ class PythonScanner(BaseScanner):
         return self._dependency_graph
 
 
-class PythonASTVisitor(ast.NodeVisitor):
-    """AST visitor for Python code analysis."""
-
-    def __init__(self):
+def _parse_file(file_path: Path, cache_dir: Optional[Path] = None) -> "PythonASTVisitor":
+    """Parse a Python file and collect its imports, functions and classes.
+
+    When a cache directory is given, results are cached under the hash of the
+    file content, so unchanged files are not parsed again on later scans.
+
+    Args:
+        file_path: Path to the Python file to parse
+        cache_dir: Optional directory holding cached parse results
+
+    Returns:
+        AST visitor holding the extracted information
+    """
+    with open(file_path, "rb") as f:
+        content = f.read()
+
+    framework_hints = {match.decode() for match in _FRAMEWORK_RE.findall(content)}
+
+    cache_path = None
+    if cache_dir is not None:
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        cache_path = cache_dir / f"{digest}_{_CACHE_VERSION}.pkl"
+        visitor = _load_cached_visitor(cache_path)
+        if visitor is not None:
+            visitor.framework_hints = framework_hints
+            return visitor
+
+    # ast.parse decodes bytes itself, honouring BOMs and encoding cookies
+    tree = ast.parse(content, filename=str(file_path))
+    visitor = PythonASTVisitor()
+    visitor.visit(tree)
+    visitor.framework_hints = framework_hints
+
+    if cache_path is not None:
+        _store_cached_visitor(cache_path, visitor)
+    return visitor
+
+
+def _load_cached_visitor(cache_path: Path) -> Optional["PythonASTVisitor"]:
+    """Load cached parse results, returning None on a cache miss."""
+    try:
+        with open(cache_path, "rb") as f:
+            imports, functions, classes = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable parse cache {cache_path}", extra={"error": str(e)})
+        return None
+
+    visitor = PythonASTVisitor()
+    visitor.imports = imports
+    visitor.functions = functions
+    visitor.classes = classes
+    return visitor
+
+
+def _store_cached_visitor(cache_path: Path, visitor: "PythonASTVisitor") -> None:
+    """Write parse results to the cache, ignoring failures."""
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                (visitor.imports, visitor.functions, visitor.classes),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write parse cache {cache_path}", extra={"error": str(e)})
+
+
+def _fast_docstring(
+    node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+) -> Optional[str]:
+    """Get the cleaned docstring of a node, like `ast.get_docstring`.
+
+    Only the first body statement is inspected, so the common undocumented
+    case returns without further work.
+    """
+    body = node.body
+    if not body:
+        return None
+    first = body[0]
+    if not isinstance(first, ast.Expr):
+        return None
+    value = first.value
+    if isinstance(value, ast.Constant) and isinstance(value.value, str):
+        return inspect.cleandoc(value.value)
+    return None
+
+
+class PythonASTVisitor:
+    """AST visitor for Python code analysis.
+
+    Only statement blocks are traversed; expression subtrees never contain
+    imports, function or class definitions, so they are skipped entirely.
+    """
+
+    def __init__(self) -> None:
         """Initialize the visitor."""
         self.imports: List[ImportInfo] = []
         self.functions: List[FunctionInfo] = []
         self.classes: List[ClassInfo] = []
+        # Frameworks named anywhere in the source, set by the file parser
+        self.framework_hints: Set[str] = set()
         self._current_class: Optional[ClassInfo] = None
 
     def visit_Import(self, node: ast.Import) -> None:
@@ -431,7 +576,6 @@ class PythonASTVisitor(ast.NodeVisitor):
                 alias=name.asname,
                 line_number=node.lineno
             ))
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Process ImportFrom nodes."""
@@ -442,19 +586,19 @@ class PythonASTVisitor(ast.NodeVisitor):
                 imported_names={name.name},
                 is_from_import=True,
                 alias=name.asname,
-                line_number=node.lineno
+                line_number=node.lineno,
+                level=node.level
             ))
-        self.generic_visit(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Process FunctionDef nodes."""
         self._process_function(node, is_async=False)
-        self.generic_visit(node)
+        self._visit_blocks(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         """Process AsyncFunctionDef nodes."""
         self._process_function(node, is_async=True)
-        self.generic_visit(node)
+        self._visit_blocks(node)
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Process ClassDef nodes."""
@@ -466,7 +610,7 @@ class PythonASTVisitor(ast.NodeVisitor):
             bases=bases,
             decorators=decorators,
             line_number=node.lineno,
-            docstring=ast.get_docstring(node)
+            docstring=_fast_docstring(node)
         )
 
         # Set as current class for method detection
@@ -474,17 +618,52 @@ class PythonASTVisitor(ast.NodeVisitor):
         self._current_class = class_info
 
         # Visit class body
-        self.generic_visit(node)
+        self._visit_blocks(node)
 
         # Restore previous class context
         self._current_class = prev_class
         self.classes.append(class_info)
 
+    # Handlers dispatched by exact node type
+    _dispatch: ClassVar[Dict[type, Callable[["PythonASTVisitor", ast.AST], None]]] = {
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+        ast.FunctionDef: visit_FunctionDef,
+        ast.AsyncFunctionDef: visit_AsyncFunctionDef,
+        ast.ClassDef: visit_ClassDef,
+    }
+
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node, dispatching on its type."""
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(self, node)
+        else:
+            self._visit_blocks(node)
+
+    def _visit_blocks(self, node: ast.AST) -> None:
+        """Visit the statements nested in a node's statement blocks."""
+        for field_name in _BLOCK_FIELDS:
+            for child in getattr(node, field_name, ()):
+                self.visit(child)
+
     def _process_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], is_async: bool) -> None:
         """Process function definition nodes."""
         args = [arg.arg for arg in node.args.args]
         decorators = [self._get_name(d) for d in node.decorator_list]
 
+        # Classify decorators once for the framework and component passes
+        has_route_decorator = False
+        http_method_decorator = None
+        for decorator in decorators:
+            if "route" in decorator:
+                has_route_decorator = True
+            if http_method_decorator is None:
+                lowered = decorator.lower()
+                http_method_decorator = next(
+                    (method for method in _HTTP_METHODS if method in lowered), None
+                )
+
         func_info = FunctionInfo(
             name=node.name,
             args=args,
@@ -492,7 +671,9 @@ class PythonASTVisitor(ast.NodeVisitor):
             is_async=is_async,
             is_method=bool(self._current_class),
             line_number=node.lineno,
-            docstring=ast.get_docstring(node)
+            docstring=_fast_docstring(node),
+            has_route_decorator=has_route_decorator,
+            http_method_decorator=http_method_decorator
         )
 
         if self._current_class:
@@ -502,10 +683,19 @@ class PythonASTVisitor(ast.NodeVisitor):
 
     def _get_name(self, node: ast.AST) -> str:
         """Get string representation of a name node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Call):
-            return self._get_name(node.func)
-        return str(node)
+        # Walk dotted chains iteratively, collecting parts right to left
+        parts: List[str] = []
+        while True:
+            if isinstance(node, ast.Attribute):
+                parts.append(node.attr)
+                node = node.value
+            elif isinstance(node, ast.Call):
+                node = node.func
+            else:
+                break
+
+        parts.append(node.id if isinstance(node, ast.Name) else str(node))
+        if len(parts) == 1:
+            return parts[0]
+        parts.reverse()
+        return ".".join(parts)
@@ -1,8 +1,11 @@
 """Repository management functionality for cloning and handling Git repositories."""
 
+import asyncio
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Union
 from urllib.parse import urlparse
@@ -16,6 +19,8 @@ from src.utils.validation_utils import validate_url, validate_path
 class RepositoryManager:
     """Manages Git repository operations including cloning and cleanup."""
 
+    __slots__ = ("repo_url", "target_dir", "repo", "_temp_dir")
+
     def __init__(self, repo_url: str, target_dir: Optional[Union[str, Path]] = None):
         """Initialize repository manager.
 
@@ -23,14 +28,15 @@ class RepositoryManager:
             repo_url: URL of the Git repository
             target_dir: Optional directory to clone into. If None, uses temporary directory
         """
-        self.repo_url = validate_url(repo_url, "Repository URL")
+        self.repo_url = validate_url(repo_url, name="Repository URL")
         self._validate_git_url(self.repo_url)
 
+        self._temp_dir: Optional[Path] = None
         if target_dir:
             self.target_dir = validate_path(target_dir, should_exist=False, name="Target directory")
         else:
-            self.temp_dir = tempfile.mkdtemp(prefix="llm_test_framework_")
-            self.target_dir = Path(self.temp_dir)
+            self._temp_dir = Path(tempfile.mkdtemp(prefix="llm_test_framework_"))
+            self.target_dir = self._temp_dir
 
         self.repo: Optional[git.Repo] = None
 
@@ -53,6 +59,9 @@ class RepositoryManager:
     def clone(self) -> Path:
         """Clone the repository to the target directory.
 
+        Only the latest commit of the default branch is fetched, since
+        scanning needs the working tree rather than the history.
+
         Returns:
             Path to the cloned repository
 
@@ -60,15 +69,58 @@ class RepositoryManager:
             GitCommandError: If cloning fails
         """
         try:
-            self.repo = git.Repo.clone_from(self.repo_url, self.target_dir)
+            self.repo = git.Repo.clone_from(
+                self.repo_url,
+                self.target_dir,
+                depth=1,
+                multi_options=["--single-branch"]
+            )
             return self.target_dir
         except GitCommandError as e:
             raise GitCommandError(f"Failed to clone repository: {e.command}", e.status, e.stderr)
 
+    async def clone_async(self) -> Path:
+        """Clone the repository from within a running event loop.
+
+        Runs the same shallow, single-branch clone as `clone` in a `git`
+        subprocess, so the event loop is not blocked while it runs.
+
+        Returns:
+            Path to the cloned repository
+
+        Raises:
+            GitCommandError: If cloning fails
+        """
+        command = [
+            "git", "clone", "--depth", "1", "--single-branch",
+            self.repo_url, str(self.target_dir)
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise GitCommandError(
+                "Failed to clone repository: git clone",
+                process.returncode,
+                stderr.decode(errors="replace")
+            )
+
+        self.repo = git.Repo(self.target_dir)
+        return self.target_dir
+
     def cleanup(self) -> None:
-        """Clean up temporary directory if one was created."""
-        if hasattr(self, 'temp_dir') and self.temp_dir:
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Clean up temporary directory if one was created.
+
+        The temporary directory is kept until this is called. Errors while
+        removing it are ignored.
+        """
+        if self._temp_dir is not None:
+            _remove_subdirectories(self._temp_dir)
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
 
     def get_default_branch(self) -> str:
         """Get the default branch name of the repository.
@@ -107,3 +159,26 @@ class RepositoryManager:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit point."""
         self.cleanup()
+
+
+def _remove_subdirectories(directory: Path, max_workers: int = 8) -> None:
+    """Remove the top-level subdirectories of a directory concurrently.
+
+    Errors are ignored; whatever is left, along with plain files, is
+    removed by the caller's regular cleanup.
+
+    Args:
+        directory: Directory whose subdirectories to remove
+        max_workers: Maximum number of deletion threads
+    """
+    try:
+        with os.scandir(directory) as entries:
+            subdirectories = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+
+    if len(subdirectories) <= 1:
+        return
+    remove = partial(shutil.rmtree, ignore_errors=True)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirectories))) as executor:
+        list(executor.map(remove, subdirectories))
@@ -1,7 +1,11 @@
 """Test approach recommendation module."""
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple
+from functools import wraps
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+from uuid import UUID
 import networkx as nx
 
 from ..models.dependency_graph import DependencyGraph
@@ -23,6 +27,21 @@ class TestingApproach:
     disadvantages: List[str]  # Drawbacks of this approach
 
 
+T = TypeVar("T")
+
+
+def _memoized(predicate: Callable[["TestApproachRecommender"], T]) -> Callable[["TestApproachRecommender"], T]:
+    """Cache a predicate's result until the next recommendation starts."""
+    @wraps(predicate)
+    def wrapper(self: "TestApproachRecommender") -> T:
+        cache = self._predicate_cache
+        name = predicate.__name__
+        if name not in cache:
+            cache[name] = predicate(self)
+        return cache[name]
+    return wrapper
+
+
 class TestApproachRecommender:
     """Analyzes codebase and recommends testing approaches."""
 
@@ -32,8 +51,19 @@ class TestApproachRecommender:
         self.integration_points = integration_points
         self.critical_components = self.dependency_graph.get_critical_components()
 
+        # Integration point and component counts shared by the predicates
+        self._type_counts = Counter(p.integration_type for p in integration_points)
+        self._num_points = len(integration_points)
+        self._num_components = len(self.dependency_graph.components)
+        self._num_relationships = len(self.dependency_graph.relationships)
+
+        # Results of predicates shared between evaluators
+        self._predicate_cache: Dict[str, Any] = {}
+
     def recommend_approach(self) -> TestingApproach:
         """Analyze the codebase and recommend the best testing approach."""
+        self._predicate_cache.clear()
+
         # Calculate scores for each approach
         top_down_score = self._evaluate_top_down()
         bottom_up_score = self._evaluate_bottom_up()
@@ -321,29 +351,42 @@ class TestApproachRecommender:
             ]
         )
 
+    @_memoized
+    def _node_levels(self) -> Optional[Dict[UUID, int]]:
+        """Get the topological generation of each node, or None if the graph has cycles."""
+        try:
+            return {
+                node: i
+                for i, level in enumerate(nx.topological_generations(self.dependency_graph.graph))
+                for node in level
+            }
+        except nx.NetworkXUnfeasible:
+            return None
+
+    @_memoized
     def _has_clear_hierarchy(self) -> bool:
         """Check if the dependency graph has a clear hierarchical structure."""
+        node_levels = self._node_levels()
+        if node_levels is None:
+            return False
+
         # Calculate the number of levels in the graph
-        try:
-            levels = nx.topological_generations(self.dependency_graph.graph)
-            num_levels = sum(1 for _ in levels)
-            total_nodes = len(self.dependency_graph.graph)
+        num_levels = max(node_levels.values(), default=-1) + 1
+        total_nodes = len(self.dependency_graph.graph)
 
-            # If there are several distinct levels relative to total nodes,
-            # consider it hierarchical
-            return num_levels >= 3 and num_levels <= total_nodes / 2
-        except nx.NetworkXUnfeasible:
-            return False
+        # If there are several distinct levels relative to total nodes,
+        # consider it hierarchical
+        return num_levels >= 3 and num_levels <= total_nodes / 2
 
+    @_memoized
     def _has_well_defined_interfaces(self) -> bool:
         """Check if components have well-defined interfaces."""
-        api_points = [p for p in self.integration_points if p.integration_type == "api"]
-        return len(api_points) >= len(self.dependency_graph.get_components()) * 0.3
+        return self._type_counts["api"] >= self._num_components * 0.3
 
     def _has_more_interface_integrations(self) -> bool:
         """Check if interface-level integrations dominate."""
-        interface_count = len([p for p in self.integration_points if p.integration_type == "api"])
-        other_count = len([p for p in self.integration_points if p.integration_type != "api"])
+        interface_count = self._type_counts["api"]
+        other_count = self._num_points - interface_count
         return interface_count > other_count
 
     def _can_create_stubs_easily(self) -> bool:
@@ -352,52 +395,52 @@ class TestApproachRecommender:
         return (self._has_well_defined_interfaces() and
                 not self._has_significant_cycles())
 
+    @_memoized
     def _has_significant_cycles(self) -> bool:
         """Check if there are significant circular dependencies."""
-        cycles = self.dependency_graph.find_cycles()
-        return len(cycles) > len(self.dependency_graph.get_components()) * 0.1
+        threshold = self._num_components * 0.1
+
+        # Cycles are generated lazily, so stop counting once past the threshold
+        cycles = islice(nx.simple_cycles(self.dependency_graph.graph), int(threshold) + 1)
+        return sum(1 for _ in cycles) > threshold
 
     def _has_complex_low_level_components(self) -> bool:
         """Check if there are complex low-level components."""
         # Consider components with high complexity but few dependencies as low-level
-        return any(c.complexity_score > 0.7 for c in self.dependency_graph.get_components())
+        return any(c.complexity_score > 0.7 for c in self.dependency_graph.components.values())
 
+    @_memoized
     def _has_many_external_dependencies(self) -> bool:
         """Check if there are many external dependencies."""
-        external_points = [p for p in self.integration_points
-                         if p.integration_type in ["database", "service"]]
-        return len(external_points) >= len(self.dependency_graph.get_components()) * 0.3
+        external_count = self._type_counts["database"] + self._type_counts["service"]
+        return external_count >= self._num_components * 0.3
 
     def _can_test_in_isolation(self) -> bool:
         """Check if components can be tested in isolation."""
         # Look for components with minimal dependencies
-        return any(len(self.dependency_graph.get_dependencies(c)) <= 2
-                  for c in self.dependency_graph.get_components())
+        return any(degree <= 2 for _, degree in self._out_degrees())
+
+    def _out_degrees(self) -> Iterable[Tuple[UUID, int]]:
+        """Get the number of dependencies of each component."""
+        return self.dependency_graph.graph.out_degree(self.dependency_graph.components)
 
     def _has_clear_boundaries(self) -> bool:
         """Check if components have clear boundaries."""
-        # Look for limited cross-component dependencies
-        for component in self.dependency_graph.get_components():
-            deps = self.dependency_graph.get_dependencies(component)
-            if len(deps) > 5:  # Arbitrary threshold
-                return False
-        return True
+        # Look for limited cross-component dependencies (arbitrary threshold)
+        return not any(degree > 5 for _, degree in self._out_degrees())
 
     def _has_significant_upward_dependencies(self) -> bool:
         """Check if there are significant upward dependencies."""
-        try:
-            levels = list(nx.topological_generations(self.dependency_graph.graph))
-            for i, level in enumerate(levels[:-1]):
-                for node in level:
-                    successors = set(self.dependency_graph.graph.successors(node))
-                    # Check if node has dependencies on higher levels
-                    for higher_level in levels[i+1:]:
-                        if successors & set(higher_level):
-                            return True
-            return False
-        except nx.NetworkXUnfeasible:
+        node_levels = self._node_levels()
+        if node_levels is None:
             return True
 
+        # Check if any node has dependencies on higher levels
+        return any(
+            node_levels[target] > node_levels[source]
+            for source, target in self.dependency_graph.graph.edges
+        )
+
     def _has_mixed_architecture(self) -> bool:
         """Check if the system has a mix of architectural patterns."""
         has_hierarchy = self._has_clear_hierarchy()
@@ -407,20 +450,16 @@ class TestApproachRecommender:
     def _has_independent_subsystems(self) -> bool:
         """Check if there are independent subsystems."""
         # Look for strongly connected components
-        sccs = self.dependency_graph.get_strongly_connected_components()
-        return len(sccs) > 1
+        return nx.number_strongly_connected_components(self.dependency_graph.graph) > 1
 
     def _has_balanced_integration_types(self) -> bool:
         """Check if there's a balance of integration types."""
-        types = [p.integration_type for p in self.integration_points]
-        unique_types = set(types)
-        if len(unique_types) < 2:
+        if len(self._type_counts) < 2:
             return False
 
         # Check if no single type dominates (>60%)
-        for type_name in unique_types:
-            count = sum(1 for t in types if t == type_name)
-            if count / len(types) > 0.6:
+        for count in self._type_counts.values():
+            if count / self._num_points > 0.6:
                 return False
         return True
 
@@ -429,37 +468,35 @@ class TestApproachRecommender:
         if not self.critical_components:
             return False
 
-        try:
-            levels = list(nx.topological_generations(self.dependency_graph.graph))
-            critical_levels = set()
-            for component in self.critical_components:
-                for i, level in enumerate(levels):
-                    if component.id in level:
-                        critical_levels.add(i)
-                        break
-            return len(critical_levels) > 1
-        except nx.NetworkXUnfeasible:
+        node_levels = self._node_levels()
+        if node_levels is None:
             return False
 
+        critical_levels = {
+            node_levels[component.id]
+            for component in self.critical_components
+            if component.id in node_levels
+        }
+        return len(critical_levels) > 1
+
     def _has_moderate_complexity(self) -> bool:
         """Check if the system has moderate complexity."""
-        num_components = len(self.dependency_graph.get_components())
-        num_relationships = len(self.dependency_graph.get_relationships())
-        return 5 <= num_components <= 20 and num_relationships <= num_components * 3
+        num_components = self._num_components
+        return 5 <= num_components <= 20 and self._num_relationships <= num_components * 3
 
+    @_memoized
     def _is_small_system(self) -> bool:
         """Check if it's a small system."""
-        return len(self.dependency_graph.get_components()) <= 5
+        return self._num_components <= 5
 
     def _has_few_integration_points(self) -> bool:
         """Check if there are few integration points."""
-        return len(self.integration_points) <= 5
+        return self._num_points <= 5
 
     def _is_tightly_coupled(self) -> bool:
         """Check if components are tightly coupled."""
-        num_components = len(self.dependency_graph.get_components())
-        num_relationships = len(self.dependency_graph.get_relationships())
-        return num_relationships >= (num_components * (num_components - 1)) / 4
+        num_components = self._num_components
+        return self._num_relationships * 4 >= num_components * (num_components - 1)
 
     def _needs_quick_feedback(self) -> bool:
         """Check if quick feedback is needed."""
@@ -1,14 +1,55 @@
 """Base class for test order generation algorithms."""
 
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Set, Tuple, TypeVar
 from uuid import UUID
 
+import networkx as nx
+
 from ...models.dependency_graph import DependencyGraph
 from ...models.component import Component
 from ...models.relationship import Relationship
 
+N = TypeVar("N", bound=Hashable)
+
+# Component ids and (source id, target id, type, strength) of every relationship
+GraphFingerprint = Tuple[FrozenSet[UUID], FrozenSet[Tuple[UUID, UUID, str, float]]]
+
+
+def _kahn_sort(
+    nodes: Iterable[N],
+    successors: Mapping[N, Iterable[N]],
+    reverse: bool = False
+) -> Optional[List[N]]:
+    """Topologically sort nodes with Kahn's algorithm.
+
+    Nodes come out in the same order as ``nx.topological_sort``; with
+    ``reverse`` the list is filled from the end, so dependencies come first.
+    Returns None if the nodes contain a cycle.
+    """
+    in_degree = dict.fromkeys(nodes, 0)
+    for node in in_degree:
+        for successor in successors[node]:
+            in_degree[successor] += 1
+
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    order: List[N] = [None] * len(in_degree)
+    index, step = (len(order) - 1, -1) if reverse else (0, 1)
+    while queue:
+        node = queue.popleft()
+        order[index] = node
+        index += step
+        for successor in successors[node]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+
+    if index != (-1 if reverse else len(order)):
+        return None
+    return order
+
 
 @dataclass
 class TestOrderResult:
@@ -19,35 +60,190 @@ class TestOrderResult:
     justification: List[str]  # Reasons for the chosen order
     metrics: Dict[str, float]  # Metrics about the order (e.g., stub count)
     level_assignments: Dict[Component, int]  # Level assigned to each component
+    fingerprint: Optional[GraphFingerprint] = None  # Graph the order was generated for
 
 
 class TestOrderGenerator(ABC):
-    """Base class for test order generation algorithms."""
+    """Base class for test order generation algorithms.
+
+    A generator is bound to the dependency graph as it was at construction:
+    components, relationships and the dependencies derived from them are
+    captured once in `__init__`, and every method works on that snapshot.
+    Edits made to the graph afterwards are not seen; create a new generator
+    to order the edited graph.
+    """
 
-    def __init__(self, dependency_graph: DependencyGraph):
-        """Initialize the test order generator."""
+    def __init__(self, dependency_graph: DependencyGraph, verbose: bool = True):
+        """Initialize the test order generator.
+
+        Args:
+            dependency_graph: Graph of the components to order
+            verbose: Whether justifications include a line for every component
+        """
         self.dependency_graph = dependency_graph
+        self.verbose = verbose
         self.components = dependency_graph.get_components()
         self.relationships = dependency_graph.get_relationships()
+        self._component_by_id: Dict[UUID, Component] = {comp.id: comp for comp in self.components}
+        for rel in self.relationships:
+            self._component_by_id.setdefault(rel.source.id, rel.source)
+            self._component_by_id.setdefault(rel.target.id, rel.target)
+
+        # Direct dependencies and dependents of each component
+        dependencies: Dict[Component, Set[Component]] = {comp: set() for comp in self.components}
+        dependents: Dict[Component, Set[Component]] = {comp: set() for comp in self.components}
+        for rel in self.relationships:
+            dependencies.setdefault(rel.source, set()).add(rel.target)
+            dependents.setdefault(rel.target, set()).add(rel.source)
+        self._dependencies = {comp: frozenset(deps) for comp, deps in dependencies.items()}
+        self._dependents = {comp: frozenset(deps) for comp, deps in dependents.items()}
+
+        # Relationship between each (source id, target id) pair
+        self._rel_by_pair: Dict[Tuple[UUID, UUID], Relationship] = {
+            (rel.source.id, rel.target.id): rel for rel in self.relationships
+        }
+        self._fingerprint: Optional[GraphFingerprint] = None
 
     @abstractmethod
     def generate_order(self) -> TestOrderResult:
         """Generate a test order for the components."""
         pass
 
+    def regenerate_order(self, changed_components: Set[Component], prior: TestOrderResult) -> TestOrderResult:
+        """Generate a test order, reusing an earlier result where the graph is unchanged.
+
+        The graph is compared through `fingerprint`, which is taken from this
+        generator's construction-time snapshot, so changes to the graph are
+        only noticed by a generator created after them. BLW, TJJM and MDTOG
+        keep the cycle-breaking decisions of cyclic SCCs that did not change;
+        Tai-Daniels generates a new order from scratch.
+
+        Args:
+            changed_components: Components whose attributes (e.g. scores) changed since `prior`
+            prior: Result generated for an earlier version of the graph
+
+        Returns:
+            `prior` itself if nothing changed, otherwise a new result
+        """
+        if not changed_components and prior.fingerprint == self.fingerprint:
+            return prior
+        return self._regenerate_order(changed_components, prior)
+
+    def _regenerate_order(self, changed_components: Set[Component], prior: TestOrderResult) -> TestOrderResult:
+        """Generate a test order for a graph that changed since `prior`."""
+        return self.generate_order()
+
+    def _unchanged_sccs(
+        self,
+        sccs: List[Set[Component]],
+        changed_components: Set[Component],
+        prior: TestOrderResult
+    ) -> Set[int]:
+        """Find cyclic SCCs whose cycles were broken the same way in a prior result.
+
+        An SCC qualifies if none of its components changed, all of them were
+        ordered in `prior`, and the relationships inside it are the same as
+        in the graph `prior` was generated from.
+
+        Returns:
+            Indices into `sccs`
+        """
+        if prior.fingerprint is None:
+            return set()
+
+        prior_ids = {component.id for component in prior.order}
+        scc_of: Dict[UUID, int] = {}
+        for i, scc in enumerate(sccs):
+            if (
+                len(scc) > 1
+                and scc.isdisjoint(changed_components)
+                and all(component.id in prior_ids for component in scc)
+            ):
+                scc_of.update((component.id, i) for component in scc)
+        if not scc_of:
+            return set()
+
+        # Relationships inside each candidate SCC, now and in the prior graph
+        internal: Dict[int, Set[Tuple]] = defaultdict(set)
+        prior_internal: Dict[int, Set[Tuple]] = defaultdict(set)
+        for edges, by_scc in ((self.fingerprint[1], internal), (prior.fingerprint[1], prior_internal)):
+            for edge in edges:
+                i = scc_of.get(edge[0])
+                if i is not None and scc_of.get(edge[1]) == i:
+                    by_scc[i].add(edge)
+
+        return {i for i in set(scc_of.values()) if internal[i] == prior_internal[i]}
+
+    @staticmethod
+    def _prior_removed_edges(scc: Set[Component], prior: TestOrderResult) -> List[Tuple[UUID, UUID]]:
+        """Get the edges inside an SCC that a prior result broke with stubs."""
+        return [
+            (component.id, stub.id)
+            for component in scc
+            for stub in prior.stubs.get(component, ())
+            if stub in scc
+        ]
+
+    def rebind_result(self, result: TestOrderResult) -> TestOrderResult:
+        """Rebind a result generated by a copy of this generator, e.g. in a worker process.
+
+        Components in the result are replaced by this generator's own
+        instances, so callers see the same objects as in the graph.
+        """
+        own = self._component_by_id
+        return TestOrderResult(
+            order=[own[comp.id] for comp in result.order],
+            stubs={
+                own[comp.id]: {own[stub.id] for stub in stubs}
+                for comp, stubs in result.stubs.items()
+            },
+            justification=result.justification,
+            metrics=result.metrics,
+            level_assignments={own[comp.id]: level for comp, level in result.level_assignments.items()},
+            fingerprint=result.fingerprint
+        )
+
+    @property
+    def fingerprint(self) -> GraphFingerprint:
+        """Identify the components and relationships the generator works on."""
+        if self._fingerprint is None:
+            self._fingerprint = (
+                frozenset(comp.id for comp in self.components),
+                frozenset(
+                    (rel.source.id, rel.target.id, rel.relationship_type, rel.strength)
+                    for rel in self.relationships
+                )
+            )
+        return self._fingerprint
+
+    def _build_graph(self) -> nx.DiGraph:
+        """Build a fresh graph of component ids from the construction-time snapshot.
+
+        Nodes and edges are added in the same order as in the dependency
+        graph, so traversals visit them in the same order.
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(comp.id for comp in self.components)
+        graph.add_edges_from((rel.source.id, rel.target.id) for rel in self.relationships)
+        return graph
+
+    def _strongly_connected_components(self, graph: nx.DiGraph) -> List[Set[Component]]:
+        """Find the strongly connected components of a graph of component ids."""
+        return [
+            {self._component_by_id[node_id] for node_id in scc}
+            for scc in nx.strongly_connected_components(graph)
+        ]
+
     def calculate_required_stubs(self, order: List[Component]) -> Dict[Component, Set[Component]]:
         """Calculate required stubs for a given test order."""
         stubs: Dict[Component, Set[Component]] = {comp: set() for comp in self.components}
         tested_components = set()
 
         for component in order:
-            # Get all dependencies of the current component
-            dependencies = {rel.target for rel in self.dependency_graph.get_dependencies(component)}
-
             # Any dependency not yet tested needs a stub
-            for dep in dependencies:
-                if dep not in tested_components:
-                    stubs[component].add(dep)
+            untested = self.get_component_dependencies(component) - tested_components
+            if untested:
+                stubs[component].update(untested)
 
             tested_components.add(component)
 
@@ -55,8 +251,12 @@ class TestOrderGenerator(ABC):
 
     def calculate_metrics(self, order: List[Component], stubs: Dict[Component, Set[Component]]) -> Dict[str, float]:
         """Calculate metrics for the test order."""
-        total_stubs = sum(len(stub_set) for stub_set in stubs.values())
-        components_with_stubs = sum(1 for stub_set in stubs.values() if stub_set)
+        total_stubs = 0
+        components_with_stubs = 0
+        for stub_set in stubs.values():
+            if stub_set:
+                total_stubs += len(stub_set)
+                components_with_stubs += 1
 
         return {
             "total_stub_count": total_stubs,
@@ -101,17 +301,13 @@ class TestOrderGenerator(ABC):
             if rel.relationship_type == "association"
         ]
 
-    def get_component_dependencies(self, component: Component) -> Set[Component]:
-        """Get all components that a given component depends on."""
-        return {
-            rel.target for rel in self.dependency_graph.get_dependencies(component)
-        }
+    def get_component_dependencies(self, component: Component) -> FrozenSet[Component]:
+        """Get all components that a given component depends on, as of construction."""
+        return self._dependencies.get(component, frozenset())
 
-    def get_component_dependents(self, component: Component) -> Set[Component]:
-        """Get all components that depend on a given component."""
-        return {
-            rel.source for rel in self.dependency_graph.get_dependents(component)
-        }
+    def get_component_dependents(self, component: Component) -> FrozenSet[Component]:
+        """Get all components that depend on a given component, as of construction."""
+        return self._dependents.get(component, frozenset())
 
     def get_dependency_count(self, component: Component) -> int:
         """Get the number of dependencies for a component."""
@@ -135,5 +331,6 @@ class TestOrderGenerator(ABC):
             stubs=stubs,
             justification=justification,
             metrics=metrics,
-            level_assignments=level_assignments
+            level_assignments=level_assignments,
+            fingerprint=self.fingerprint
         )
@@ -1,10 +1,10 @@
 """Implementation of the Briand-Labiche-Wang (BLW) test order generation algorithm."""
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import networkx as nx
 from uuid import UUID
 
-from .base import TestOrderGenerator, TestOrderResult
+from .base import TestOrderGenerator, TestOrderResult, _kahn_sort
 from ...models.component import Component
 from ...models.relationship import Relationship
 
@@ -19,17 +19,35 @@ class BLWOrderGenerator(TestOrderGenerator):
     4. Generating a test order that minimizes specific stub complexity
     """
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the BLW order generator."""
+        super().__init__(*args, **kwargs)
+        self._edge_complexities: Dict[Tuple[UUID, UUID], float] = {}
+
     def generate_order(self) -> TestOrderResult:
         """Generate a test order using the BLW algorithm."""
+        return self._generate_order()
+
+    def _regenerate_order(self, changed_components: Set[Component], prior: TestOrderResult) -> TestOrderResult:
+        """Generate a test order, keeping the prior broken edges of unchanged cyclic SCCs."""
+        return self._generate_order(changed_components, prior)
+
+    def _generate_order(
+        self,
+        changed_components: Set[Component] = frozenset(),
+        prior: Optional[TestOrderResult] = None
+    ) -> TestOrderResult:
+        """Generate a test order, optionally reusing broken edges from a prior result."""
         justification = []
 
         # Step 1: Find strongly connected components
-        sccs = self.dependency_graph.get_strongly_connected_components()
+        graph = self._build_graph()
+        sccs = self._strongly_connected_components(graph)
         justification.append(f"Found {len(sccs)} strongly connected components")
 
         # If no cycles, use topological sort directly
         if all(len(scc) == 1 for scc in sccs):
-            order = list(reversed(self._generate_order_from_dag()))
+            order = self._generate_order_from_dag()
             stubs = self.calculate_required_stubs(order)
             justification.append("No cycles found, using topological sort")
             return self.create_result(
@@ -39,14 +57,21 @@ class BLWOrderGenerator(TestOrderGenerator):
                 level_assignments=self._assign_levels(order)
             )
 
-        # Step 2: Create a copy of the graph for modification
-        modified_graph = nx.DiGraph(self.dependency_graph.graph)
+        # Step 2: The graph was built for this run, so it can be modified in place
+        modified_graph = graph
 
         # Step 3: Process each SCC with more than one component
+        reusable = self._unchanged_sccs(sccs, changed_components, prior) if prior else set()
         edges_to_remove = []
-        for scc in sccs:
-            if len(scc) > 1:
-                scc_edges = self._find_edges_to_break_cycle(scc)
+        for i, scc in enumerate(sccs):
+            if i in reusable:
+                scc_edges = self._prior_removed_edges(scc, prior)
+                edges_to_remove.extend(scc_edges)
+                justification.append(
+                    f"Reusing {len(scc_edges)} removed edges of unchanged SCC of size {len(scc)}"
+                )
+            elif len(scc) > 1:
+                scc_edges = self._find_edges_to_break_cycle(modified_graph, scc)
                 edges_to_remove.extend(scc_edges)
                 justification.append(
                     f"Breaking cycle in SCC of size {len(scc)} by removing {len(scc_edges)} edges"
@@ -60,15 +85,17 @@ class BLWOrderGenerator(TestOrderGenerator):
         order = self._generate_order_from_modified_graph(modified_graph)
 
         # Step 6: Calculate required stubs based on removed edges
+        removed_targets: Dict[UUID, List[UUID]] = {}
+        for source_id, target_id in edges_to_remove:
+            removed_targets.setdefault(source_id, []).append(target_id)
+
         stubs = {}
         total_complexity = 0
         for component in order:
             stubs[component] = set()
-            for edge in edges_to_remove:
-                if edge[0] == component.id:
-                    target_comp = self.dependency_graph.get_component(edge[1])
-                    stubs[component].add(target_comp)
-                    total_complexity += self._calculate_stub_complexity(component, target_comp)
+            for target_id in removed_targets.get(component.id, []):
+                stubs[component].add(self._component_by_id[target_id])
+                total_complexity += self._edge_complexity((component.id, target_id))
 
         # Step 7: Assign levels based on the final order
         level_assignments = self._assign_levels(order)
@@ -83,74 +110,98 @@ class BLWOrderGenerator(TestOrderGenerator):
             level_assignments=level_assignments
         )
 
-    def _find_edges_to_break_cycle(self, scc: Set[Component]) -> List[Tuple[UUID, UUID]]:
+    def _find_edges_to_break_cycle(self, graph: nx.DiGraph, scc: Set[Component]) -> List[Tuple[UUID, UUID]]:
         """Find optimal edges to remove to break cycles in a strongly connected component.
 
         BLW prioritizes:
         1. Association edges over inheritance/aggregation
         2. Edges with lower stub complexity
         3. Edges that break multiple cycles
-        """
-        scc_subgraph = nx.DiGraph(self.dependency_graph.graph.subgraph([c.id for c in scc]))
-        edges_to_remove = []
 
-        while not self._is_acyclic(scc_subgraph):
-            edge = self._select_edge_to_break(scc_subgraph)
-            if edge:
+        One edge is removed from every remaining cyclic SCC, then the SCCs of
+        what is left are recomputed, until none remain.
+        """
+        # Work on a copy labelled with compact integer ids, which hash far
+        # faster than UUIDs; edge ids index the per-edge selection data
+        subgraph = graph.subgraph([c.id for c in scc])
+        node_ids = list(subgraph)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        scc_subgraph = nx.DiGraph()
+        scc_subgraph.add_nodes_from(range(len(node_ids)))
+        scc_subgraph.add_edges_from((index[u], index[v]) for u, v in subgraph.edges())
+
+        # A self-loop can only be broken by removing it
+        edges_to_remove = list(nx.selfloop_edges(scc_subgraph))
+        scc_subgraph.remove_edges_from(edges_to_remove)
+
+        edge_ids = {edge: i for i, edge in enumerate(scc_subgraph.edges())}
+        is_association = [
+            self._rel_by_pair[(node_ids[u], node_ids[v])].relationship_type == 'association'
+            for u, v in edge_ids
+        ]
+        costs = [  # Add 1 to avoid division by zero
+            self._edge_complexity((node_ids[u], node_ids[v])) + 1 for u, v in edge_ids
+        ]
+
+        while True:
+            cyclic = [nodes for nodes in nx.strongly_connected_components(scc_subgraph) if len(nodes) > 1]
+            if not cyclic:
+                break
+            for nodes in cyclic:
+                edge = self._select_edge_to_break(scc_subgraph, nodes, edge_ids, is_association, costs)
                 edges_to_remove.append(edge)
                 scc_subgraph.remove_edge(*edge)
-            else:
-                break
 
-        return edges_to_remove
-
-    def _select_edge_to_break(self, graph: nx.DiGraph) -> Tuple[UUID, UUID]:
-        """Select an edge to break based on BLW criteria."""
-        cycles = list(nx.simple_cycles(graph))
-        if not cycles:
-            return None
-
-        # Get all edges in cycles with their relationship types
-        edge_info = {}
-        for cycle in cycles:
-            for i in range(len(cycle)):
-                edge = (cycle[i], cycle[(i + 1) % len(cycle)])
-                if edge in graph.edges():
-                    if edge not in edge_info:
-                        source = self.dependency_graph.get_component(edge[0])
-                        target = self.dependency_graph.get_component(edge[1])
-                        rel_type = self.dependency_graph.get_relationship(source, target).relationship_type
-                        complexity = self._calculate_stub_complexity(source, target)
-                        cycle_count = 1
-                        edge_info[edge] = {
-                            'type': rel_type,
-                            'complexity': complexity,
-                            'cycle_count': cycle_count
-                        }
-                    else:
-                        edge_info[edge]['cycle_count'] += 1
+        return [(node_ids[u], node_ids[v]) for u, v in edges_to_remove]
+
+    def _select_edge_to_break(
+        self,
+        graph: nx.DiGraph,
+        nodes: Set[int],
+        edge_ids: Dict[Tuple[int, int], int],
+        is_association: List[bool],
+        costs: List[float]
+    ) -> Tuple[int, int]:
+        """Select an edge to break inside one strongly connected component.
+
+        The number of cycles through an edge (u, v) is approximated by
+        in_degree(u) * out_degree(v) within the component. `is_association`
+        and `costs` (stub complexity + 1) are indexed by `edge_ids`.
+        """
+        edges = [(u, v) for u in sorted(nodes) for v in graph.successors(u) if v in nodes]
+        in_degree = [0] * len(graph)
+        out_degree = [0] * len(graph)
+        for u, v in edges:
+            out_degree[u] += 1
+            in_degree[v] += 1
 
         # First, try to find association edges
-        association_edges = {e: info for e, info in edge_info.items()
-                           if info['type'] == 'association'}
-
-        if association_edges:
-            candidates = association_edges
-        else:
-            candidates = edge_info
+        ids = [edge_ids[edge] for edge in edges]
+        candidates = [
+            (edge, i) for edge, i in zip(edges, ids) if is_association[i]
+        ] or list(zip(edges, ids))
 
         # Select edge with best score (highest cycles broken per complexity)
         best_edge = None
         best_score = -1
 
-        for edge, info in candidates.items():
-            score = info['cycle_count'] / (info['complexity'] + 1)  # Add 1 to avoid division by zero
+        for (u, v), i in candidates:
+            score = in_degree[u] * out_degree[v] / costs[i]
             if score > best_score:
                 best_score = score
-                best_edge = edge
+                best_edge = (u, v)
 
         return best_edge
 
+    def _edge_complexity(self, edge: Tuple[UUID, UUID]) -> float:
+        """Get the stub complexity of an edge, computed once per edge."""
+        complexity = self._edge_complexities.get(edge)
+        if complexity is None:
+            source = self._component_by_id[edge[0]]
+            target = self._component_by_id[edge[1]]
+            complexity = self._edge_complexities[edge] = self._calculate_stub_complexity(source, target)
+        return complexity
+
     def _calculate_stub_complexity(self, source: Component, target: Component) -> float:
         """Calculate the complexity of creating a stub for the target component.
 
@@ -163,7 +214,7 @@ class BLWOrderGenerator(TestOrderGenerator):
         base_complexity = target.complexity_score if target.complexity_score is not None else 0.5
 
         # Add complexity based on the relationship type
-        rel = self.dependency_graph.get_relationship(source, target)
+        rel = self._rel_by_pair[(source.id, target.id)]
         type_multiplier = {
             'inheritance': 2.0,  # Inheritance stubs are most complex
             'aggregation': 1.5,  # Aggregation stubs are moderately complex
@@ -172,29 +223,19 @@ class BLWOrderGenerator(TestOrderGenerator):
 
         return base_complexity * type_multiplier
 
-    def _is_acyclic(self, graph: nx.DiGraph) -> bool:
-        """Check if a graph is acyclic."""
-        try:
-            nx.find_cycle(graph)
-            return False
-        except nx.NetworkXNoCycle:
-            return True
-
     def _generate_order_from_dag(self) -> List[Component]:
-        """Generate a test order from a directed acyclic graph using topological sort."""
-        try:
-            node_order = list(nx.topological_sort(self.dependency_graph.graph))
-            return [self.dependency_graph.get_component(node_id) for node_id in node_order]
-        except nx.NetworkXUnfeasible:
+        """Generate a dependencies-first test order from a directed acyclic graph."""
+        order = _kahn_sort(self.components, self._dependencies, reverse=True)
+        if order is None:
             raise ValueError("Graph contains cycles, cannot perform topological sort")
+        return order
 
     def _generate_order_from_modified_graph(self, modified_graph: nx.DiGraph) -> List[Component]:
         """Generate a test order from the modified graph."""
-        try:
-            node_order = list(reversed(list(nx.topological_sort(modified_graph))))
-            return [self.dependency_graph.get_component(node_id) for node_id in node_order]
-        except nx.NetworkXUnfeasible:
+        node_order = _kahn_sort(modified_graph, modified_graph.succ, reverse=True)
+        if node_order is None:
             raise ValueError("Modified graph still contains cycles")
+        return [self._component_by_id[node_id] for node_id in node_order]
 
     def _assign_levels(self, order: List[Component]) -> Dict[Component, int]:
         """Assign levels to components based on their position in the test order."""
@@ -1,12 +1,12 @@
 """Implementation of the Minimum Dependency Test Order Generation algorithm."""
 
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+from typing import Dict, List, Optional, Set
+from collections import deque
 import networkx as nx
 
 from ...models.component import Component
 from ...models.relationship import Relationship
-from .base import TestOrderGenerator, TestOrderResult
+from .base import TestOrderGenerator, TestOrderResult, _kahn_sort
 
 
 class MDTOGOrderGenerator(TestOrderGenerator):
@@ -30,14 +30,32 @@ class MDTOGOrderGenerator(TestOrderGenerator):
 
     def generate_order(self) -> TestOrderResult:
         """Generate a test order using the MDTOG algorithm."""
+        return self._generate_order()
+
+    def _regenerate_order(self, changed_components: Set[Component], prior: TestOrderResult) -> TestOrderResult:
+        """Generate a test order, keeping the prior order of unchanged cyclic SCCs."""
+        return self._generate_order(changed_components, prior)
+
+    def _generate_order(
+        self,
+        changed_components: Set[Component] = frozenset(),
+        prior: Optional[TestOrderResult] = None
+    ) -> TestOrderResult:
+        """Generate a test order, optionally reusing SCC orders from a prior result."""
         # Step 1: Create weighted dependency graph
         weighted_graph = self._create_weighted_graph()
 
         # Step 2: Find strongly connected components
         sccs = list(nx.strongly_connected_components(weighted_graph))
 
-        # Step 3: Break cycles using minimum feedback arc set
-        ordered_components = self._break_cycles_and_order(weighted_graph, sccs)
+        # Step 3: Break cycles using minimum feedback arc set, unless there
+        # are none (a lone component can still depend on itself)
+        ordered_components = None
+        if all(len(scc) == 1 for scc in sccs):
+            ordered_components = _kahn_sort(weighted_graph, weighted_graph.succ)
+        if ordered_components is None:
+            reusable = self._reusable_scc_orders(sccs, changed_components, prior) if prior else {}
+            ordered_components = self._break_cycles_and_order(weighted_graph, sccs, reusable)
 
         # Step 4: Calculate required stubs
         stubs = self.calculate_required_stubs(ordered_components)
@@ -70,80 +88,118 @@ class MDTOGOrderGenerator(TestOrderGenerator):
 
         return graph
 
+    def _reusable_scc_orders(
+        self,
+        sccs: List[Set[Component]],
+        changed_components: Set[Component],
+        prior: TestOrderResult
+    ) -> Dict[int, List[Component]]:
+        """Find cyclic SCCs whose component order can be taken from a prior result.
+
+        Returns:
+            Prior order of the components, keyed by index into `sccs`
+        """
+        position = {component.id: i for i, component in enumerate(prior.order)}
+        return {
+            i: sorted(sccs[i], key=lambda component: position[component.id])
+            for i in self._unchanged_sccs(sccs, changed_components, prior)
+        }
+
     def _break_cycles_and_order(
         self,
         graph: nx.DiGraph,
-        sccs: List[Set[Component]]
+        sccs: List[Set[Component]],
+        reusable: Optional[Dict[int, List[Component]]] = None
     ) -> List[Component]:
-        """Break cycles and create a test order."""
+        """Break cycles and create a test order.
+
+        SCCs found in `reusable` take the given component order as is.
+        """
         ordered_components = []
         processed = set()
+        reusable = reusable or {}
 
-        # Process SCCs in topological order
-        condensed = nx.condensation(graph, scc=sccs)
-        for scc_id in nx.topological_sort(condensed):
-            scc = sccs[scc_id]
+        # Process SCCs in topological order; strongly_connected_components
+        # yields them in reverse topological order
+        for scc_index in range(len(sccs) - 1, -1, -1):
+            scc = sccs[scc_index]
 
-            if len(scc) == 1:
+            if scc_index in reusable:
+                ordered_components.extend(reusable[scc_index])
+                processed.update(reusable[scc_index])
+            elif len(scc) == 1:
                 # Single component, just add it
                 component = list(scc)[0]
                 if component not in processed:
                     ordered_components.append(component)
                     processed.add(component)
             else:
-                # Multiple components, find minimum feedback arc set
-                subgraph = graph.subgraph(scc)
-                feedback_edges = self._find_minimum_feedback_arc_set(subgraph)
-
-                # Remove feedback edges temporarily
-                for u, v in feedback_edges:
-                    if graph.has_edge(u, v):
-                        graph.remove_edge(u, v)
-
-                # Add components in topological order
-                for component in nx.topological_sort(subgraph):
+                # Multiple components, order them around a minimum feedback arc set
+                for component in self._order_around_feedback_arc_set(graph, scc):
                     if component not in processed:
                         ordered_components.append(component)
                         processed.add(component)
 
-                # Restore feedback edges
-                for u, v in feedback_edges:
-                    graph.add_edge(u, v)
-
         return ordered_components
 
-    def _find_minimum_feedback_arc_set(self, graph: nx.DiGraph) -> List[Tuple[Component, Component]]:
-        """Find minimum feedback arc set using a greedy algorithm."""
-        feedback_edges = []
-        while not nx.is_directed_acyclic_graph(graph):
-            # Find edge that participates in most cycles
-            max_cycles = 0
-            worst_edge = None
-
-            for edge in graph.edges():
-                graph.remove_edge(*edge)
-                num_cycles = len(list(nx.simple_cycles(graph)))
-                graph.add_edge(*edge)
-
-                if num_cycles > max_cycles:
-                    max_cycles = num_cycles
-                    worst_edge = edge
-
-            if worst_edge:
-                feedback_edges.append(worst_edge)
-                graph.remove_edge(*worst_edge)
+    def _order_around_feedback_arc_set(self, graph: nx.DiGraph, scc: Set[Component]) -> List[Component]:
+        """Order an SCC's components using the Eades-Lin-Smyth heuristic.
+
+        Sinks are peeled off to the back of a node sequence and sources to the
+        front; when neither exists, the node with the largest out-degree minus
+        in-degree goes to the front. Edges pointing backwards in the sequence
+        form a small feedback arc set, and every other edge points forwards,
+        so the sequence is a topological order once those edges are broken.
+        Only a local adjacency restricted to the SCC is built; the graph
+        itself is not modified.
+        """
+        succ = {node: {t for t in graph.successors(node) if t in scc and t != node} for node in scc}
+        pred = {node: {s for s in graph.predecessors(node) if s in scc and s != node} for node in scc}
+        remaining = dict.fromkeys(scc)
+        front: List[Component] = []
+        back: List[Component] = []
+
+        sinks = deque(node for node in scc if not succ[node])
+        sources = deque(node for node in scc if not pred[node])
+
+        def remove(node: Component) -> None:
+            del remaining[node]
+            for target in succ[node]:
+                pred[target].discard(node)
+                if not pred[target]:
+                    sources.append(target)
+            for source in pred[node]:
+                succ[source].discard(node)
+                if not succ[source]:
+                    sinks.append(source)
+
+        while remaining:
+            if sinks:
+                node = sinks.popleft()
+                if node in remaining:
+                    back.append(node)
+                    remove(node)
+            elif sources:
+                node = sources.popleft()
+                if node in remaining:
+                    front.append(node)
+                    remove(node)
+            else:
+                node = max(remaining, key=lambda n: len(succ[n]) - len(pred[n]))
+                front.append(node)
+                remove(node)
 
-        return feedback_edges
+        back.reverse()
+        return front + back
 
     def _assign_levels(self, ordered_components: List[Component]) -> Dict[Component, int]:
         """Assign levels to components based on dependencies."""
         levels = {}
-        graph = self._create_weighted_graph()
 
         for component in ordered_components:
             # Find maximum level of dependencies
             max_dep_level = -1
-            for pred in graph.predecessors(component):
+            for pred in self.get_component_dependents(component):
                 if pred in levels:
                     max_dep_level = max(max_dep_level, levels[pred])
 
@@ -180,6 +236,9 @@ class MDTOGOrderGenerator(TestOrderGenerator):
             f"Components requiring stubs: {components_with_stubs}"
         ])
 
+        if not self.verbose:
+            return justification
+
         # Add specific component ordering justification
         for i, component in enumerate(order):
             deps = self.get_component_dependencies(component)
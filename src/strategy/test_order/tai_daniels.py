@@ -1,6 +1,7 @@
 """Implementation of the Tai-Daniels algorithm for test order generation."""
 
-from typing import Dict, List, Set, Tuple
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 
 from ...models.component import Component
@@ -26,6 +27,8 @@ class TaiDanielsOrderGenerator(TestOrderGenerator):
             "aggregation": 2,
             "association": 1
         }
+        # Weighted dependencies and the relationship weights they were built with
+        self._weighted_deps: Optional[Tuple[Dict[str, float], Dict[Component, Dict[Component, float]]]] = None
 
     def generate_order(self) -> TestOrderResult:
         """Generate a test order using the Tai-Daniels algorithm."""
@@ -53,63 +56,83 @@ class TaiDanielsOrderGenerator(TestOrderGenerator):
         )
 
     def _calculate_weighted_dependencies(self) -> Dict[Component, Dict[Component, float]]:
-        """Calculate weighted dependencies between components."""
-        weighted_deps = defaultdict(lambda: defaultdict(float))
+        """Calculate weighted dependencies between components.
+
+        The result is reused until the relationship weights change.
+        """
+        if self._weighted_deps is not None and self._weighted_deps[0] == self.relationship_weights:
+            return self._weighted_deps[1]
+
+        weighted_deps: Dict[Component, Dict[Component, float]] = {comp: {} for comp in self.components}
 
         for rel in self.relationships:
             weight = self.relationship_weights.get(rel.relationship_type, 1.0)
-            weighted_deps[rel.source][rel.target] += weight * rel.strength
+            deps = weighted_deps.setdefault(rel.source, {})
+            deps[rel.target] = deps.get(rel.target, 0.0) + weight * rel.strength
 
+        self._weighted_deps = (dict(self.relationship_weights), weighted_deps)
         return weighted_deps
 
     def _assign_levels(self, weighted_deps: Dict[Component, Dict[Component, float]]) -> Dict[int, List[Component]]:
-        """Assign components to levels based on weighted dependencies."""
+        """Assign components to levels based on weighted dependencies.
+
+        Levels are built by Kahn layering: a component joins the level after
+        the one in which its last unassigned dependency was placed.
+        """
         levels: Dict[int, List[Component]] = defaultdict(list)
+        index = {component: i for i, component in enumerate(self.components)}
+
+        # Count unassigned dependencies and record who depends on each component
+        unassigned_deps: Dict[Component, int] = {}
+        dependents_of: Dict[Component, List[Component]] = defaultdict(list)
+        for component in self.components:
+            deps = [dep for dep, weight in weighted_deps[component].items() if weight > 0]
+            unassigned_deps[component] = len(deps)
+            for dep in deps:
+                dependents_of[dep].append(component)
+
+        # Cycle candidates by fewest unassigned dependencies, built when the
+        # first cycle is hit; outdated entries are skipped
+        heap = None
+
         assigned = set()
+        level_components = [c for c in self.components if unassigned_deps[c] == 0]
         level = 0
 
         while len(assigned) < len(self.components):
-            # Find components with no unassigned dependencies
-            level_components = []
-            for component in self.components:
-                if component in assigned:
-                    continue
-
-                has_unassigned_deps = False
-                for dep, weight in weighted_deps[component].items():
-                    if dep not in assigned and weight > 0:
-                        has_unassigned_deps = True
-                        break
-
-                if not has_unassigned_deps:
-                    level_components.append(component)
-
             # Handle cycles by choosing component with minimum dependencies
             if not level_components:
-                min_deps = float('inf')
-                cycle_component = None
-
-                for component in self.components:
-                    if component in assigned:
-                        continue
-
-                    unassigned_deps = sum(
-                        1 for dep, weight in weighted_deps[component].items()
-                        if dep not in assigned and weight > 0
-                    )
-
-                    if unassigned_deps < min_deps:
-                        min_deps = unassigned_deps
-                        cycle_component = component
-
-                if cycle_component:
-                    level_components.append(cycle_component)
+                if heap is None:
+                    heap = [
+                        (count, index[component]) for component, count in unassigned_deps.items()
+                        if component not in assigned
+                    ]
+                    heapq.heapify(heap)
+                while True:
+                    count, i = heapq.heappop(heap)
+                    cycle_component = self.components[i]
+                    if cycle_component not in assigned and count == unassigned_deps[cycle_component]:
+                        break
+                level_components = [cycle_component]
 
             # Add components to current level
             levels[level].extend(level_components)
             assigned.update(level_components)
             level += 1
 
+            # Components whose last unassigned dependency was just assigned form the next level
+            ready = []
+            for component in level_components:
+                for dependent in dependents_of[component]:
+                    if dependent in assigned:
+                        continue
+                    unassigned_deps[dependent] -= 1
+                    if unassigned_deps[dependent] == 0:
+                        ready.append(dependent)
+                    elif heap is not None:
+                        heapq.heappush(heap, (unassigned_deps[dependent], index[dependent]))
+            level_components = sorted(ready, key=index.__getitem__)
+
         return levels
 
     def _order_within_levels(
@@ -164,6 +187,9 @@ class TaiDanielsOrderGenerator(TestOrderGenerator):
             f"Components requiring stubs: {components_with_stubs}"
         ])
 
+        if not self.verbose:
+            return justification
+
         # Add specific component ordering justification
         for i, component in enumerate(order):
             deps = self.get_component_dependencies(component)
@@ -1,10 +1,10 @@
 """Implementation of the Traon-Jéron-Jézéquel-Morel (TJJM) test order generation algorithm."""
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import networkx as nx
 from uuid import UUID
 
-from .base import TestOrderGenerator, TestOrderResult
+from .base import TestOrderGenerator, TestOrderResult, _kahn_sort
 from ...models.component import Component
 from ...models.relationship import Relationship
 
@@ -20,15 +20,28 @@ class TJJMOrderGenerator(TestOrderGenerator):
 
     def generate_order(self) -> TestOrderResult:
         """Generate a test order using the TJJM algorithm."""
+        return self._generate_order()
+
+    def _regenerate_order(self, changed_components: Set[Component], prior: TestOrderResult) -> TestOrderResult:
+        """Generate a test order, keeping the prior broken edges of unchanged cyclic SCCs."""
+        return self._generate_order(changed_components, prior)
+
+    def _generate_order(
+        self,
+        changed_components: Set[Component] = frozenset(),
+        prior: Optional[TestOrderResult] = None
+    ) -> TestOrderResult:
+        """Generate a test order, optionally reusing broken edges from a prior result."""
         justification = []
 
         # Step 1: Find strongly connected components
-        sccs = self.dependency_graph.get_strongly_connected_components()
+        graph = self._build_graph()
+        sccs = self._strongly_connected_components(graph)
         justification.append(f"Found {len(sccs)} strongly connected components")
 
         # If no cycles, use topological sort directly
         if all(len(scc) == 1 for scc in sccs):
-            order = list(reversed(self._generate_order_from_dag()))  # Reverse for correct dependencies
+            order = self._generate_order_from_dag()
             stubs = self.calculate_required_stubs(order)
             justification.append("No cycles found, using topological sort")
             return self.create_result(
@@ -38,14 +51,21 @@ class TJJMOrderGenerator(TestOrderGenerator):
                 level_assignments=self._assign_levels(order)
             )
 
-        # Step 2: Create a copy of the graph for modification
-        modified_graph = nx.DiGraph(self.dependency_graph.graph)
+        # Step 2: The graph was built for this run, so it can be modified in place
+        modified_graph = graph
 
         # Step 3: Process each SCC with more than one component
+        reusable = self._unchanged_sccs(sccs, changed_components, prior) if prior else set()
         edges_to_remove = []
-        for scc in sccs:
-            if len(scc) > 1:
-                scc_edges = self._find_edges_to_break_cycle(scc)
+        for i, scc in enumerate(sccs):
+            if i in reusable:
+                scc_edges = self._prior_removed_edges(scc, prior)
+                edges_to_remove.extend(scc_edges)
+                justification.append(
+                    f"Reusing {len(scc_edges)} removed edges of unchanged SCC of size {len(scc)}"
+                )
+            elif len(scc) > 1:
+                scc_edges = self._find_edges_to_break_cycle(modified_graph, scc)
                 edges_to_remove.extend(scc_edges)
                 justification.append(
                     f"Breaking cycle in SCC of size {len(scc)} by removing {len(scc_edges)} edges"
@@ -59,13 +79,16 @@ class TJJMOrderGenerator(TestOrderGenerator):
         order = self._generate_order_from_modified_graph(modified_graph)
 
         # Step 6: Calculate required stubs based on removed edges
+        removed_targets: Dict[UUID, List[UUID]] = {}
+        for source_id, target_id in edges_to_remove:
+            removed_targets.setdefault(source_id, []).append(target_id)
+
         stubs = {}
         for component in order:
-            stubs[component] = set()
-            for edge in edges_to_remove:
-                if edge[0] == component.id:
-                    target_comp = self.dependency_graph.get_component(edge[1])
-                    stubs[component].add(target_comp)
+            stubs[component] = {
+                self._component_by_id[target_id]
+                for target_id in removed_targets.get(component.id, [])
+            }
 
         # Step 7: Assign levels based on the final order
         level_assignments = self._assign_levels(order)
@@ -81,78 +104,91 @@ class TJJMOrderGenerator(TestOrderGenerator):
             level_assignments=level_assignments
         )
 
-    def _find_edges_to_break_cycle(self, scc: Set[Component]) -> List[Tuple[UUID, UUID]]:
-        """Find optimal edges to remove to break cycles in a strongly connected component."""
-        # Create a mutable copy of the subgraph
-        scc_subgraph = nx.DiGraph(self.dependency_graph.graph.subgraph([c.id for c in scc]))
-        edges_to_remove = []
-
-        while not self._is_acyclic(scc_subgraph):
-            edge = self._select_edge_to_break(scc_subgraph)
-            if edge:
+    def _find_edges_to_break_cycle(self, graph: nx.DiGraph, scc: Set[Component]) -> List[Tuple[UUID, UUID]]:
+        """Find optimal edges to remove to break cycles in a strongly connected component.
+
+        One edge is removed from every remaining cyclic SCC, then the SCCs of
+        what is left are recomputed, until none remain.
+        """
+        # Work on a copy labelled with compact integer ids, which hash far
+        # faster than UUIDs in the repeated betweenness computations
+        subgraph = graph.subgraph([c.id for c in scc])
+        node_ids = list(subgraph)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        scc_subgraph = nx.DiGraph()
+        scc_subgraph.add_nodes_from(range(len(node_ids)))
+        scc_subgraph.add_edges_from((index[u], index[v]) for u, v in subgraph.edges())
+
+        # A self-loop can only be broken by removing it
+        edges_to_remove = list(nx.selfloop_edges(scc_subgraph))
+        scc_subgraph.remove_edges_from(edges_to_remove)
+
+        while True:
+            cyclic = [nodes for nodes in nx.strongly_connected_components(scc_subgraph) if len(nodes) > 1]
+            if not cyclic:
+                break
+            for nodes in cyclic:
+                edge = self._select_edge_to_break(scc_subgraph, nodes)
                 edges_to_remove.append(edge)
                 scc_subgraph.remove_edge(*edge)
-            else:
-                break  # Shouldn't happen, but prevent infinite loop
-
-        return edges_to_remove
-
-    def _select_edge_to_break(self, graph: nx.DiGraph) -> Tuple[UUID, UUID]:
-        """Select an edge to break based on TJJM criteria."""
-        cycles = list(nx.simple_cycles(graph))
-        if not cycles:
-            return None
-
-        # Find edges that appear in the most cycles
-        edge_cycle_count = {}
-        for cycle in cycles:
-            for i in range(len(cycle)):
-                edge = (cycle[i], cycle[(i + 1) % len(cycle)])
-                if edge in graph.edges():
-                    edge_cycle_count[edge] = edge_cycle_count.get(edge, 0) + 1
-
-        if not edge_cycle_count:
-            return None
-
-        # Select edge that appears in the most cycles and has minimal impact
-        best_edge = None
-        max_cycles = 0
-        min_impact = float('inf')
-
-        for edge, cycle_count in edge_cycle_count.items():
-            # Calculate impact (number of paths that would require stubs)
-            impact = len(list(nx.descendants(graph, edge[1])))
-
-            if cycle_count > max_cycles or (cycle_count == max_cycles and impact < min_impact):
-                max_cycles = cycle_count
-                min_impact = impact
-                best_edge = edge
-
-        return best_edge
-
-    def _is_acyclic(self, graph: nx.DiGraph) -> bool:
-        """Check if a graph is acyclic."""
-        try:
-            nx.find_cycle(graph)
-            return False
-        except nx.NetworkXNoCycle:
-            return True
+
+        return [(node_ids[u], node_ids[v]) for u, v in edges_to_remove]
+
+    def _select_edge_to_break(self, graph: nx.DiGraph, nodes: Set[int]) -> Tuple[int, int]:
+        """Select an edge to break inside one strongly connected component.
+
+        The edge with the highest betweenness within the component (the share
+        of shortest paths running through it) stands in for the edge on the
+        most cycles; ties go to the edge with minimal impact.
+        """
+        betweenness = nx.edge_betweenness_centrality(graph.subgraph(nodes))
+        max_betweenness = max(betweenness.values())
+        candidates = [edge for edge, value in betweenness.items() if value == max_betweenness]
+        if len(candidates) == 1:
+            return candidates[0]
+
+        # Impact: number of components reachable from the edge's target
+        descendant_counts = self._count_descendants(graph)
+        return min(candidates, key=lambda edge: descendant_counts[edge[1]])
+
+    @staticmethod
+    def _count_descendants(graph: nx.DiGraph) -> Dict[int, int]:
+        """Count the nodes reachable from every node of a graph without self-loops.
+
+        Reachable nodes are collected per SCC of the condensation as int
+        bitmasks, in reverse topological order, so every SCC is visited once.
+        """
+        condensed = nx.condensation(graph)
+        bit = {node: 1 << i for i, node in enumerate(graph)}
+        reachable: Dict[int, int] = {}
+        counts = {}
+        for scc in reversed(list(nx.topological_sort(condensed))):
+            members = condensed.nodes[scc]["members"]
+            mask = 0
+            for node in members:
+                mask |= bit[node]
+            for successor in condensed.successors(scc):
+                mask |= reachable[successor]
+            reachable[scc] = mask
+
+            # Every member reaches the whole SCC, itself excluded
+            count = bin(mask).count("1") - 1
+            counts.update(dict.fromkeys(members, count))
+        return counts
 
     def _generate_order_from_dag(self) -> List[Component]:
-        """Generate a test order from a directed acyclic graph using topological sort."""
-        try:
-            node_order = list(nx.topological_sort(self.dependency_graph.graph))
-            return [self.dependency_graph.get_component(node_id) for node_id in node_order]
-        except nx.NetworkXUnfeasible:
+        """Generate a dependencies-first test order from a directed acyclic graph."""
+        order = _kahn_sort(self.components, self._dependencies, reverse=True)
+        if order is None:
             raise ValueError("Graph contains cycles, cannot perform topological sort")
+        return order
 
     def _generate_order_from_modified_graph(self, modified_graph: nx.DiGraph) -> List[Component]:
         """Generate a test order from the modified graph."""
-        try:
-            node_order = list(reversed(list(nx.topological_sort(modified_graph))))  # Reverse for correct dependencies
-            return [self.dependency_graph.get_component(node_id) for node_id in node_order]
-        except nx.NetworkXUnfeasible:
+        node_order = _kahn_sort(modified_graph, modified_graph.succ, reverse=True)
+        if node_order is None:
             raise ValueError("Modified graph still contains cycles")
+        return [self._component_by_id[node_id] for node_id in node_order]
 
     def _assign_levels(self, order: List[Component]) -> Dict[Component, int]:
         """Assign levels to components based on their position in the test order."""
@@ -1,5 +1,7 @@
 """Test order algorithm selector and comparison module."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import networkx as nx
@@ -11,6 +13,10 @@ from .test_order.blw import BLWOrderGenerator
 from ..models.component import Component
 from ..models.dependency_graph import DependencyGraph
 
+# Below this many components, generating all orders in-process is faster
+# than starting worker processes
+MIN_PARALLEL_COMPONENTS = 50
+
 
 @dataclass
 class AlgorithmComparison:
@@ -34,21 +40,52 @@ class TestOrderSelector:
             'TJJM': TJJMOrderGenerator(dependency_graph),
             'BLW': BLWOrderGenerator(dependency_graph)
         }
-
-    def compare_algorithms(self) -> Dict[str, AlgorithmComparison]:
-        """Compare all available algorithms and return their metrics."""
-        comparisons = {}
-
-        for name, algorithm in self.algorithms.items():
-            result = algorithm.generate_order()
-            comparison = self._evaluate_algorithm(name, result)
-            comparisons[name] = comparison
-
-        return comparisons
+        self._density: Optional[Tuple[Tuple[int, int], float]] = None
+
+    def compare_algorithms(self, num_processors: Optional[int] = None) -> Dict[str, AlgorithmComparison]:
+        """Compare all available algorithms and return their metrics.
+
+        On graphs of at least `MIN_PARALLEL_COMPONENTS` components the orders
+        are generated concurrently in a process pool; results are evaluated
+        on the calling process.
+
+        Args:
+            num_processors: Number of worker processes (default: CPU count)
+        """
+        return self._evaluate_results(self._generate_orders(num_processors))
+
+    def _evaluate_results(self, results: Dict[str, TestOrderResult]) -> Dict[str, AlgorithmComparison]:
+        """Evaluate every algorithm's generated order."""
+        return {name: self._evaluate_algorithm(name, result) for name, result in results.items()}
+
+    def _generate_orders(self, num_processors: Optional[int] = None) -> Dict[str, TestOrderResult]:
+        """Generate every algorithm's order, in a process pool where worthwhile."""
+        results: Dict[str, TestOrderResult] = {}
+        num_processors = min(num_processors or os.cpu_count() or 1, len(self.algorithms))
+        if num_processors > 1 and len(self.dependency_graph.get_components()) >= MIN_PARALLEL_COMPONENTS:
+            try:
+                with ProcessPoolExecutor(max_workers=num_processors) as executor:
+                    futures = {
+                        executor.submit(_run_generator, algorithm): name
+                        for name, algorithm in self.algorithms.items()
+                    }
+                    for future in as_completed(futures):
+                        name = futures[future]
+                        results[name] = self.algorithms[name].rebind_result(future.result())
+            except Exception:
+                # E.g. a graph that cannot be pickled or a broken pool;
+                # whatever did not complete is generated in-process below
+                pass
+
+        return {
+            name: results[name] if name in results else algorithm.generate_order()
+            for name, algorithm in self.algorithms.items()
+        }
 
     def select_best_algorithm(self) -> Tuple[str, TestOrderResult, List[str]]:
         """Select the best algorithm based on project characteristics and results."""
-        comparisons = self.compare_algorithms()
+        results = self._generate_orders()
+        comparisons = self._evaluate_results(results)
 
         # Calculate weighted scores
         weights = self._calculate_weights()
@@ -72,8 +109,8 @@ class TestOrderSelector:
         justification.append(f"Selected {best_algorithm} as the best algorithm based on:")
         justification.extend(comparisons[best_algorithm].justification)
 
-        # Generate final result
-        result = self.algorithms[best_algorithm].generate_order()
+        # Final result, generated for the comparison
+        result = results[best_algorithm]
 
         return best_algorithm, result, justification
 
@@ -145,8 +182,12 @@ class TestOrderSelector:
         for component in result.order:
             deps = self.dependency_graph.get_dependencies(component)
             total_deps += len(deps)
+            stubs = result.stubs[component]
+            if not stubs:
+                preserved_deps += len(deps)
+                continue
             for dep in deps:
-                if dep.target not in result.stubs[component]:
+                if dep.target not in stubs:
                     preserved_deps += 1
 
         dependency_score = preserved_deps / total_deps if total_deps > 0 else 1.0
@@ -163,7 +204,7 @@ class TestOrderSelector:
         n_edges = graph.number_of_edges()
 
         # Calculate graph metrics
-        density = nx.density(graph)
+        density = self._graph_density()
         try:
             avg_clustering = nx.average_clustering(graph)
         except:
@@ -189,8 +230,7 @@ class TestOrderSelector:
 
     def _calculate_weights(self) -> Dict[str, float]:
         """Calculate weights for different metrics based on project characteristics."""
-        graph = self.dependency_graph.graph
-        density = nx.density(graph)
+        density = self._graph_density()
 
         # Adjust weights based on graph characteristics
         if density < 0.3:  # Sparse graph
@@ -214,3 +254,19 @@ class TestOrderSelector:
                 'quality': 0.2,
                 'suitability': 0.2
             }
+
+    def _graph_density(self) -> float:
+        """Get the density of the dependency graph, computed once per graph size."""
+        graph = self.dependency_graph.graph
+        key = (graph.number_of_nodes(), graph.number_of_edges())
+        if self._density is None or self._density[0] != key:
+            self._density = (key, nx.density(graph))
+        return self._density[1]
+
+
+def _run_generator(generator: TestOrderGenerator) -> TestOrderResult:
+    """Generate a test order in a worker process.
+
+    Defined at module level so it can be pickled by `ProcessPoolExecutor`.
+    """
+    return generator.generate_order()
@@ -1,13 +1,22 @@
 """File utilities for safe file operations."""
 
 import os
+import re
 import shutil
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, List, Optional, Union
+from typing import Generator, List, Optional, Pattern, Tuple, Union
 
 from src.utils.logging import logger
 
+try:
+    import blake3
+except ImportError:  # Optional, only needed for algorithm="blake3"
+    blake3 = None
+
+# Read size when hashing files without hashlib.file_digest
+_HASH_BUFFER_SIZE = 1 << 20
+
 
 def ensure_directory(path: Union[str, Path]) -> Path:
     """Ensure a directory exists, creating it if necessary.
@@ -106,6 +115,79 @@ def safe_delete_file(path: Union[str, Path]) -> None:
         raise
 
 
+def compile_glob_patterns(patterns: List[str]) -> Pattern[str]:
+    """Compile glob patterns into a single regex over relative POSIX paths.
+
+    Patterns match at any depth, as with `Path.rglob`: `*` and `?` stay
+    within one path component, `**` spans components, and a trailing `/**`
+    matches everything below a directory.
+
+    Args:
+        patterns: Glob patterns such as "**/__pycache__/**" or "*.pyc"
+
+    Returns:
+        Compiled pattern; use `match` on a path relative to the search root
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    alternatives = "|".join(f"(?:.*/)?{_glob_to_regex(pattern)}" for pattern in patterns)
+    return re.compile(f"(?:{alternatives})\\Z")
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate one glob pattern into a regex fragment."""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = _bracket_end(pattern, i)
+            if end < 0:
+                # Unclosed, so a literal bracket
+                parts.append(re.escape("["))
+                i += 1
+                continue
+            # Bracket expression, escaped as fnmatch.translate does
+            chars = pattern[i + 1:end].replace("\\", "\\\\")
+            chars = re.sub(r"([&~|])", r"\\\1", chars)
+            if chars[0] == "!":
+                # A negated class never matches across path components
+                chars = "^" + chars[1:] + "/"
+            elif chars[0] in "^[":
+                chars = "\\" + chars
+            parts.append(f"[{chars}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return "(?:" + "".join(parts) + ")"
+
+
+def _bracket_end(pattern: str, start: int) -> int:
+    """Find the `]` closing the bracket expression at `start`, or -1.
+
+    As in `fnmatch`, a `]` right after the opening `[` or `[!` is literal.
+    """
+    i = start + 1
+    if i < len(pattern) and pattern[i] == "!":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1
+    return pattern.find("]", i)
+
+
 def filter_files(
     directory: Union[str, Path],
     include_patterns: Optional[List[str]] = None,
@@ -124,24 +206,58 @@ def filter_files(
         List of Path objects for matching files
     """
     directory = Path(directory)
-    include_patterns = include_patterns or ["*"]
-    exclude_patterns = exclude_patterns or []
+    include_re = compile_glob_patterns(include_patterns or ["*"])
+    exclude_re = compile_glob_patterns(exclude_patterns or [])
+
+    # Directories below which every path is excluded are not walked at all
+    prune_re = compile_glob_patterns([p for p in exclude_patterns or [] if p.endswith("/**")])
+
+    matching_files = []
+    for entry, relative in _walk(directory, "", prune_re):
+        if not include_re.match(relative) or exclude_re.match(relative):
+            continue
+        if max_size is not None:
+            try:
+                if not entry.is_file() or entry.stat().st_size > max_size:
+                    continue
+            except OSError:
+                continue
+        elif prune_re.match(relative + "/") and entry.is_dir(follow_symlinks=False):
+            # As with rglob, a trailing `/**` also excludes the directory itself
+            continue
+        matching_files.append(directory / relative)
 
-    # First, get all files matching include patterns
-    matching_files = set()
-    for pattern in include_patterns:
-        matching_files.update(directory.rglob(pattern))
+    return sorted(matching_files)
 
-    # Remove files matching exclude patterns
-    for pattern in exclude_patterns:
-        exclude_files = set(directory.rglob(pattern))
-        matching_files -= exclude_files
 
-    # Filter by size if specified
-    if max_size is not None:
-        matching_files = {f for f in matching_files if f.is_file() and f.stat().st_size <= max_size}
+def _walk(
+    directory: Path,
+    prefix: str,
+    prune_re: Pattern[str]
+) -> Generator[Tuple[os.DirEntry, str], None, None]:
+    """Walk a directory tree once with `os.scandir`, as `Path.rglob` does.
 
-    return sorted(matching_files)
+    Symlinked directories are not followed and unreadable directories are
+    skipped.
+
+    Yields:
+        Each entry with its POSIX path relative to the walk's root
+    """
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+
+    for entry in entries:
+        relative = prefix + entry.name
+        yield entry, relative
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir and not prune_re.match(relative + "/"):
+            yield from _walk(Path(entry.path), relative + "/", prune_re)
 
 
 @contextmanager
@@ -182,7 +298,8 @@ def get_file_hash(path: Union[str, Path], algorithm: str = "sha256") -> str:
 
     Args:
         path: Path to the file
-        algorithm: Hash algorithm to use (default: sha256)
+        algorithm: Hash algorithm to use (default: sha256); any `hashlib`
+            algorithm, or "blake3" if the blake3 package is installed
 
     Returns:
         Hex digest of the file hash
@@ -190,17 +307,37 @@ def get_file_hash(path: Union[str, Path], algorithm: str = "sha256") -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
         IOError: If file reading fails
+        ImportError: If "blake3" is requested but the package is missing
     """
     import hashlib
 
     path = Path(path)
-    hash_obj = getattr(hashlib, algorithm)()
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ImportError("The blake3 package is required for blake3 file hashes")
+        hash_factory = None
+    else:
+        hash_factory = getattr(hashlib, algorithm)
 
     try:
+        if hash_factory is None:
+            # Memory-maps the file and hashes it on all cores
+            return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(path).hexdigest()
+
         with path.open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, hash_factory).hexdigest()
+
+            # Read into one reusable buffer rather than allocating per chunk
+            hash_obj = hash_factory()
+            buffer = bytearray(_HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hash_obj.update(view[:size])
+            return hash_obj.hexdigest()
     except FileNotFoundError:
         logger.error(f"File not found: {path}")
         raise
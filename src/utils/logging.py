@@ -6,6 +6,7 @@ import logging.config
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -13,6 +14,72 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 
+@lru_cache(maxsize=None)
+def _console_handler(level: int) -> logging.Handler:
+    """Get the console handler with rich formatting, shared by all loggers."""
+    console = Console(force_terminal=True)
+    handler = RichHandler(
+        console=console,
+        show_time=True,
+        show_path=True,
+        markup=True,
+        rich_tracebacks=True,
+        tracebacks_show_locals=True,
+        level=level,
+    )
+    handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    return handler
+
+
+# File handler of each logger name, replaced when its dated log file changes
+_file_handlers: Dict[str, logging.FileHandler] = {}
+
+
+def _file_handler(name: str, log_file: Path, level: int) -> logging.Handler:
+    """Get the handler writing JSON lines to a logger's log file.
+
+    A handler for an older log file of the same logger is closed first, so
+    at most one file stays open per logger name.
+    """
+    handler = _file_handlers.get(name)
+    if handler is not None:
+        if handler.baseFilename == os.path.abspath(log_file):
+            handler.setLevel(level)
+            return handler
+        handler.close()
+
+    handler = logging.FileHandler(log_file)
+    handler.setLevel(level)
+    handler.setFormatter(
+        logging.Formatter(
+            json.dumps({
+                'timestamp': '%(asctime)s',
+                'name': '%(name)s',
+                'level': '%(levelname)s',
+                'message': '%(message)s',
+                'module': '%(module)s',
+                'function': '%(funcName)s',
+                'line': '%(lineno)d',
+                'extra': '%(extra)s'
+            })
+        )
+    )
+    _file_handlers[name] = handler
+    return handler
+
+
+class _LazyJson:
+    """Context that is serialized to JSON only when a handler formats it."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Dict[str, Any]):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj)
+
+
 class StructuredLogger:
     """A logger that outputs structured logs in both console and file formats."""
 
@@ -39,52 +106,15 @@ class StructuredLogger:
         # Create log directory if it doesn't exist
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up logging configuration
-        self._configure_logging()
-
-        # Get logger instance
-        self.logger = logging.getLogger(name)
-
-    def _configure_logging(self) -> None:
-        """Configure logging with both console and file handlers."""
-        # Create console handler with rich formatting
-        console = Console(force_terminal=True)
-        console_handler = RichHandler(
-            console=console,
-            show_time=True,
-            show_path=True,
-            markup=True,
-            rich_tracebacks=True,
-            tracebacks_show_locals=True,
-            level=self.console_level,
-        )
-
-        # Create file handler with JSON formatting
+        # Attach the shared handlers to this logger only, leaving the root
+        # logger for the application to configure
         log_file = self.log_dir / f"{self.name}_{datetime.now():%Y%m%d}.log"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(self.file_level)
-        file_handler.setFormatter(
-            logging.Formatter(
-                json.dumps({
-                    'timestamp': '%(asctime)s',
-                    'name': '%(name)s',
-                    'level': '%(levelname)s',
-                    'message': '%(message)s',
-                    'module': '%(module)s',
-                    'function': '%(funcName)s',
-                    'line': '%(lineno)d',
-                    'extra': '%(extra)s'
-                })
-            )
-        )
-
-        # Configure root logger
-        logging.basicConfig(
-            level=min(self.console_level, self.file_level),
-            format="%(message)s",
-            datefmt="[%X]",
-            handlers=[console_handler, file_handler],
-        )
+        self.logger = logging.getLogger(name)
+        self.logger.handlers = [
+            _console_handler(self.console_level),
+            _file_handler(name, log_file, self.file_level),
+        ]
+        self.logger.setLevel(min(self.console_level, self.file_level))
 
     def _log(
         self,
@@ -103,8 +133,9 @@ class StructuredLogger:
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
-        extra = extra or {}
-        self.logger.log(level, msg, extra={'extra': json.dumps(extra)}, *args, **kwargs)
+        if not self.logger.isEnabledFor(level):
+            return
+        self.logger.log(level, msg, extra={'extra': _LazyJson(extra or {})}, *args, **kwargs)
 
     def debug(self, msg: str, extra: Optional[Dict[str, Any]] = None, *args, **kwargs) -> None:
         """Log a debug message."""
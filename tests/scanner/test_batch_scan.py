@@ -0,0 +1,209 @@
+"""Tests for batch scanning of multiple files."""
+
+import ast
+import asyncio
+
+import pytest
+
+from src.scanner.dotnet_scanner import DotNetScanner
+from src.scanner.python_scanner import PythonASTVisitor, PythonScanner
+from src.utils.file_utils import safe_write_file, ensure_directory
+
+
+@pytest.fixture
+def python_repo(tmp_path):
+    """Create a test repository with Python files that import each other."""
+    files = {
+        "models.py": """
+class Base:
+    pass
+
+class User(Base):
+    def save(self):
+        pass
+""",
+        "services.py": """
+from models import User
+
+def get_user(user_id):
+    return User()
+""",
+        "views.py": """
+from flask import Flask
+from services import get_user
+
+app = Flask(__name__)
+
+@app.route("/users")
+def list_users():
+    return [get_user(1)]
+""",
+        "pkg/helpers.py": """
+import os
+
+def cwd():
+    return os.getcwd()
+""",
+    }
+
+    for path, content in files.items():
+        full_path = tmp_path / "repo" / path
+        ensure_directory(full_path.parent)
+        safe_write_file(full_path, content)
+
+    return tmp_path / "repo"
+
+
+def graph_summary(scanner):
+    """Summarize a scanner's dependency graph in iteration order."""
+    return scanner.dependency_graph.to_dict()
+
+
+def record_parses(monkeypatch):
+    """Record the module of every file parsed in this process."""
+    parsed = []
+    visit = PythonASTVisitor.visit
+
+    def recording(self, node):
+        if isinstance(node, ast.Module):
+            parsed.append(node)
+        visit(self, node)
+
+    monkeypatch.setattr(PythonASTVisitor, "visit", recording)
+    return parsed
+
+
+@pytest.mark.parametrize("num_processors", [1, 2])
+def test_scan_files_matches_scan(python_repo, num_processors):
+    """Test that batch scanning builds the same graph as scanning file by file."""
+    scanner = PythonScanner(python_repo)
+    scanner.scan()
+
+    batch = PythonScanner(python_repo)
+    batch.scan_files(list(batch.get_files()), num_processors=num_processors)
+
+    assert batch.scanned_files == scanner.scanned_files
+    assert batch.get_errors() == {}
+    assert graph_summary(batch) == graph_summary(scanner)
+
+
+def test_scan_files_async_matches_scan(python_repo):
+    """Test that scanning from an event loop builds the same graph as scan()."""
+    scanner = PythonScanner(python_repo)
+    scanner.scan()
+
+    batch = PythonScanner(python_repo)
+    asyncio.run(batch.scan_files_async(batch.get_files(), num_processors=2))
+
+    assert batch.scanned_files == scanner.scanned_files
+    assert graph_summary(batch) == graph_summary(scanner)
+
+
+def test_scan_files_records_errors(python_repo):
+    """Test that a file that fails to parse does not stop the others."""
+    broken = python_repo / "broken.py"
+    safe_write_file(broken, "def broken(:\n")
+
+    scanner = PythonScanner(python_repo)
+    scanner.scan_files(list(scanner.get_files()), num_processors=1)
+
+    assert set(scanner.get_errors()) == {broken}
+    assert python_repo / "models.py" in scanner.scanned_files
+    assert broken not in scanner.scanned_files
+
+
+def test_scan_files_skips_scanned_files(python_repo, monkeypatch):
+    """Test that files scanned earlier are not parsed again."""
+    scanner = PythonScanner(python_repo)
+    files = list(scanner.get_files())
+    scanner.scan_files(files[:2], num_processors=1)
+
+    parsed = record_parses(monkeypatch)
+    scanner.scan_files(files, num_processors=1)
+
+    assert scanner.scanned_files == set(files)
+    assert len(parsed) == len(files) - 2
+
+
+def test_parse_cache_hit(python_repo, tmp_path, monkeypatch):
+    """Test that unchanged files are loaded from the parse cache."""
+    cache_dir = tmp_path / "cache"
+    scanner = PythonScanner(python_repo, cache_dir=cache_dir)
+    scanner.scan_files(list(scanner.get_files()), num_processors=1)
+    assert len(list(cache_dir.iterdir())) == len(scanner.scanned_files)
+
+    def fail(self, node):
+        raise AssertionError("file parsed despite a cached result")
+
+    monkeypatch.setattr(PythonASTVisitor, "visit", fail)
+    cached = PythonScanner(python_repo, cache_dir=cache_dir)
+    cached.scan_files(list(cached.get_files()), num_processors=1)
+
+    assert cached.get_errors() == {}
+    assert graph_summary(cached) == graph_summary(scanner)
+
+
+def test_parse_cache_invalidated_by_change(python_repo, tmp_path, monkeypatch):
+    """Test that a changed file is parsed again despite a cached result."""
+    cache_dir = tmp_path / "cache"
+    scanner = PythonScanner(python_repo, cache_dir=cache_dir)
+    scanner.scan_files(list(scanner.get_files()), num_processors=1)
+
+    changed = python_repo / "services.py"
+    safe_write_file(changed, "def create_user(name):\n    return name\n")
+
+    parsed = record_parses(monkeypatch)
+    rescanned = PythonScanner(python_repo, cache_dir=cache_dir)
+    rescanned.scan_files(list(rescanned.get_files()), num_processors=1)
+
+    assert len(parsed) == 1
+    graph = rescanned.dependency_graph
+    assert graph.get_component("services.create_user") is not None
+    assert graph.get_component("services.get_user") is None
+
+
+@pytest.mark.parametrize("scan", ["scan", "scan_files"])
+def test_scan_finalizes_graph(python_repo, scan):
+    """Test that every full scan leaves components in topological order."""
+    scanner = PythonScanner(python_repo)
+    if scan == "scan":
+        scanner.scan()
+    else:
+        scanner.scan_files(list(scanner.get_files()), num_processors=1)
+
+    graph = scanner.dependency_graph
+    names = list(graph.to_dict()["components"])
+    position = {name: i for i, name in enumerate(names)}
+    for name in names:
+        for dep in graph.get_dependencies(name):
+            if dep.target_component in position:
+                assert position[name] < position[dep.target_component]
+
+
+def test_dotnet_scan_files_matches_scan(tmp_path):
+    """Test that the C# scanner shares the batch scanning path."""
+    files = {
+        "Models/User.cs": "namespace App.Models {\n public class User {\n }\n}\n",
+        "Controllers/UserController.cs": """using App.Models;
+namespace App.Controllers {
+    [ApiController]
+    public class UserController : ControllerBase {
+        [HttpGet]
+        public User Get() { return null; }
+    }
+}
+""",
+    }
+    for path, content in files.items():
+        full_path = tmp_path / path
+        ensure_directory(full_path.parent)
+        safe_write_file(full_path, content)
+
+    scanner = DotNetScanner(tmp_path)
+    scanner.scan()
+
+    batch = DotNetScanner(tmp_path)
+    batch.scan_files(list(batch.get_files()), num_processors=2)
+
+    assert batch.scanned_files == scanner.scanned_files
+    assert graph_summary(batch) == graph_summary(scanner)
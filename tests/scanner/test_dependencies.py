@@ -185,3 +185,58 @@ def test_graph_serialization(dependency_test_repo):
     assert "components" in data
     assert any("models.User" in comp for comp in data["components"])
     assert any("views.get_user_view" in comp for comp in data["components"])
+
+
+def test_repeated_dependency_added_once(tmp_path):
+    """Test that adding the same dependency twice stores it once."""
+    graph = DependencyGraph()
+    for name in ["a", "b"]:
+        graph.add_component(ComponentInfo(name=name, file_path=tmp_path / "a.py", component_type="function"))
+
+    dependency = DependencyInfo(
+        source_file=tmp_path / "a.py",
+        source_component="a",
+        target_file=tmp_path / "a.py",
+        target_component="b",
+        dependency_type="import",
+        line_number=1
+    )
+    graph.add_dependency(dependency)
+    graph.add_dependency(dependency)
+    graph.add_edge(tmp_path / "a.py", "a", None, "b", "import", 2)
+
+    assert graph.get_dependencies("a") == {dependency, DependencyInfo(tmp_path / "a.py", "a", None, "b", "import", 2)}
+    assert len(graph.get_dependents("b")) == 2
+    assert graph.calculate_complexity("a") == 3
+
+
+def test_repeated_dependency_attaches_to_replaced_component(tmp_path):
+    """Test that a dependency seen before attaches to a component replaced since."""
+    graph = DependencyGraph()
+    component = ComponentInfo(name="a", file_path=tmp_path / "a.py", component_type="module")
+    graph.add_component(component)
+    graph.add_edge(tmp_path / "a.py", "a", None, "os", "import", 1)
+
+    graph.add_component(component)
+    assert graph.get_dependencies("a") == set()
+
+    graph.add_edge(tmp_path / "a.py", "a", None, "os", "import", 1)
+    graph.add_edge(tmp_path / "a.py", "a", None, "os", "import", 1)
+    assert len(graph.get_dependencies("a")) == 1
+
+
+def test_component_dependencies_are_deprecated(tmp_path):
+    """Test the deprecated dependency views on ComponentInfo."""
+    graph = DependencyGraph()
+    source = ComponentInfo(name="a", file_path=tmp_path / "a.py", component_type="module")
+    target = ComponentInfo(name="b", file_path=tmp_path / "b.py", component_type="module")
+    graph.add_component(source)
+    graph.add_component(target)
+    graph.add_edge(tmp_path / "a.py", "a", tmp_path / "b.py", "b", "import", 1)
+
+    with pytest.deprecated_call():
+        assert source.dependencies == graph.get_dependencies("a")
+    with pytest.deprecated_call():
+        assert target.dependents == graph.get_dependents("b")
+    with pytest.deprecated_call():
+        assert ComponentInfo(name="c", file_path=tmp_path / "c.py", component_type="module").dependencies == set()
@@ -0,0 +1,92 @@
+"""Tests for batched construction and finalization of dependency graphs."""
+
+from pathlib import Path
+
+from src.scanner.dependencies import ComponentInfo, DependencyGraph
+
+
+FILE = Path("module.py")
+
+
+def component(name):
+    """Create a component in the test file."""
+    return ComponentInfo(name=name, file_path=FILE, component_type="function")
+
+
+def edge(source, target, dependency_type="import", line_number=1):
+    """Create an edge tuple between two components of the test file."""
+    return (FILE, source, FILE, target, dependency_type, line_number)
+
+
+def component_names(graph):
+    """Get component names in the graph's iteration order."""
+    return list(graph.to_dict()["components"])
+
+
+def test_add_batch_adds_components_before_edges():
+    """Test that edges may refer to components later in the same batch."""
+    graph = DependencyGraph()
+    graph.add_batch([component("a"), component("b")], [edge("a", "b")])
+
+    assert component_names(graph) == ["a", "b"]
+    assert [dep.target_component for dep in graph.get_dependencies("a")] == ["b"]
+    assert [dep.source_component for dep in graph.get_dependents("b")] == ["a"]
+
+
+def test_add_batch_deduplicates_edges():
+    """Test that an edge repeated in a batch is added once."""
+    graph = DependencyGraph()
+    graph.add_batch(
+        [component("a"), component("b")],
+        [edge("a", "b"), edge("a", "b"), edge("a", "b", "contains"), edge("a", "b", line_number=2)]
+    )
+
+    assert sorted((dep.dependency_type, dep.line_number) for dep in graph.get_dependencies("a")) == [
+        ("contains", 1), ("import", 1), ("import", 2)
+    ]
+    assert len(graph.get_dependents("b")) == 3
+
+
+def test_add_batch_matches_individual_adds():
+    """Test that a batch builds the same graph as adding items one by one."""
+    components = [component("a"), component("b"), component("c")]
+    edges = [edge("a", "b"), edge("b", "c"), edge("a", "external")]
+
+    batched = DependencyGraph()
+    batched.add_batch(components, edges)
+
+    single = DependencyGraph()
+    for comp in components:
+        single.add_component(comp)
+    for args in edges:
+        single.add_edge(*args)
+
+    assert batched.to_dict() == single.to_dict()
+
+
+def test_finalize_orders_components_topologically():
+    """Test that finalize puts each component before its dependencies."""
+    graph = DependencyGraph()
+    graph.add_batch(
+        [component("c"), component("b"), component("a")],
+        [edge("a", "b"), edge("b", "c"), edge("a", "c")]
+    )
+
+    ordered = graph.finalize()
+
+    assert [comp.name for comp in ordered] == ["a", "b", "c"]
+    assert component_names(graph) == ["a", "b", "c"]
+
+
+def test_finalize_keeps_cycles_after_the_rest():
+    """Test that components on cycles keep their insertion order at the end."""
+    graph = DependencyGraph()
+    graph.add_batch(
+        [component("x"), component("y"), component("a"), component("b")],
+        [edge("x", "y"), edge("y", "x"), edge("a", "b"), edge("b", "external")]
+    )
+
+    graph.finalize()
+
+    assert component_names(graph) == ["a", "b", "x", "y"]
+    assert [dep.target_component for dep in graph.get_dependencies("x")] == ["y"]
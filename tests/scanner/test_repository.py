@@ -1,5 +1,6 @@
 """Tests for repository management functionality."""
 
+import gc
 import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -245,3 +246,37 @@ def test_repository_info():
             manager.get_latest_commit()
     finally:
         git.Repo.clone_from = original_clone
+
+
+def test_temporary_directory_kept_until_cleanup():
+    """Test that the default clone directory outlives the manager until cleanup."""
+    manager = RepositoryManager("https://github.com/user/repo.git")
+    target_dir = manager.target_dir
+    del manager
+    gc.collect()
+    assert target_dir.exists()
+
+    manager = RepositoryManager("https://github.com/user/repo.git")
+    safe_write_file(manager.target_dir / "pkg" / "module.py", "x = 1\n")
+    safe_write_file(manager.target_dir / "README.md", "readme\n")
+    manager.cleanup()
+    assert not manager.target_dir.exists()
+    manager.cleanup()
+    target_dir.rmdir()
+
+
+def test_cleanup_ignores_errors(monkeypatch):
+    """Test that cleanup does not raise when the directory cannot be removed."""
+    manager = RepositoryManager("https://github.com/user/repo.git")
+    target_dir = manager.target_dir
+
+    def failing_rmtree(path, ignore_errors=False, onerror=None):
+        if not ignore_errors:
+            raise OSError("cannot remove")
+
+    monkeypatch.setattr("src.scanner.repository.shutil.rmtree", failing_rmtree)
+    manager.cleanup()
+    monkeypatch.undo()
+
+    assert target_dir.exists()
+    os.rmdir(target_dir)
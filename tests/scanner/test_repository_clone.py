@@ -0,0 +1,95 @@
+"""Tests for asynchronous cloning and cleanup of repositories."""
+
+import asyncio
+
+import git
+import pytest
+from git.exc import GitCommandError
+
+from src.scanner.repository import RepositoryManager, _remove_subdirectories
+from src.utils.file_utils import safe_write_file, ensure_directory
+
+
+@pytest.fixture
+def source_repo(tmp_path):
+    """Create a local repository with two commits to clone from."""
+    path = tmp_path / "source"
+    repo = git.Repo.init(path)
+    author = git.Actor("Test", "test@example.com")
+    for i in range(2):
+        safe_write_file(path / "README.md", f"revision {i}\n")
+        repo.index.add(["README.md"])
+        repo.index.commit(f"Commit {i}", author=author, committer=author)
+    return path
+
+
+def local_manager(source, target_dir=None):
+    """Create a manager for a valid remote URL, then point it at a local repository."""
+    manager = RepositoryManager("https://github.com/user/repo.git", target_dir)
+    manager.repo_url = f"file://{source}"
+    return manager
+
+
+def test_clone_async(source_repo, tmp_path):
+    """Test that clone_async makes a shallow clone of the latest commit."""
+    manager = local_manager(source_repo, tmp_path / "clone")
+
+    path = asyncio.run(manager.clone_async())
+
+    assert path == tmp_path / "clone"
+    assert (path / "README.md").read_text() == "revision 1\n"
+    assert manager.get_latest_commit() == git.Repo(source_repo).head.commit.hexsha
+    assert len(list(manager.repo.iter_commits())) == 1
+
+
+def test_clone_async_into_temporary_directory(source_repo):
+    """Test that clone_async into a temporary directory is removed on cleanup."""
+    manager = local_manager(source_repo)
+
+    path = asyncio.run(manager.clone_async())
+    assert (path / ".git").is_dir()
+
+    manager.cleanup()
+    assert not path.exists()
+
+
+def test_clone_async_error(tmp_path):
+    """Test that a failed clone raises GitCommandError."""
+    manager = local_manager(tmp_path / "missing", tmp_path / "clone")
+
+    with pytest.raises(GitCommandError):
+        asyncio.run(manager.clone_async())
+    assert manager.repo is None
+
+
+def test_remove_subdirectories(tmp_path):
+    """Test that subdirectories are removed and plain files are kept."""
+    for name in ["a/x/y.txt", "b/z.txt", "c/empty/keep.txt"]:
+        path = tmp_path / name
+        ensure_directory(path.parent)
+        safe_write_file(path, "content")
+    safe_write_file(tmp_path / "top.txt", "content")
+
+    _remove_subdirectories(tmp_path, max_workers=2)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["top.txt"]
+
+
+def test_remove_subdirectories_keeps_symlinked_targets(tmp_path):
+    """Test that symlinks to directories are not followed."""
+    outside = tmp_path / "outside"
+    safe_write_file(outside / "keep.txt", "content")
+    directory = tmp_path / "directory"
+    for name in ["a", "b"]:
+        ensure_directory(directory / name)
+    (directory / "link").symlink_to(outside, target_is_directory=True)
+
+    _remove_subdirectories(directory)
+
+    assert (outside / "keep.txt").exists()
+    assert sorted(path.name for path in directory.iterdir()) == ["link"]
+
+
+def test_remove_subdirectories_missing_directory(tmp_path):
+    """Test that a missing directory is ignored."""
+    _remove_subdirectories(tmp_path / "missing")
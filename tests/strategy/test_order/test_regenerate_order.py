@@ -0,0 +1,136 @@
+"""Unit tests for regenerating test orders from a prior result."""
+
+import networkx as nx
+import pytest
+
+from src.models.component import Component
+from src.models.relationship import Relationship
+from src.models.dependency_graph import DependencyGraph
+from src.strategy.test_order.blw import BLWOrderGenerator
+from src.strategy.test_order.mdtog import MDTOGOrderGenerator
+from src.strategy.test_order.tjjm import TJJMOrderGenerator
+
+
+@pytest.fixture
+def components():
+    """Create a set of components for testing."""
+    return [
+        Component(name=f"Component{i}", component_type="class", location=f"file{i}.py")
+        for i in range(6)
+    ]
+
+
+@pytest.fixture
+def graph(components):
+    """Create a dependency graph with a cycle of three and a cycle of two."""
+    graph = DependencyGraph()
+    for component in components[:5]:
+        graph.add_component(component)
+
+    for source, target in [(0, 1), (1, 2), (2, 0), (0, 2), (2, 3), (3, 4), (4, 3)]:
+        graph.add_relationship(Relationship(components[source], components[target], "association"))
+    return graph
+
+
+def add_outside_edge(graph, components):
+    """Add a component depending on the first cycle, leaving both cycles intact."""
+    graph.add_component(components[5])
+    graph.add_relationship(Relationship(components[5], components[0], "association"))
+
+
+def add_inside_edge(graph, components):
+    """Add a relationship inside the first cycle."""
+    graph.add_relationship(Relationship(components[1], components[0], "association"))
+
+
+def mdtog_sccs(generator):
+    """Find the SCCs the way MDTOG does."""
+    return list(nx.strongly_connected_components(generator._create_weighted_graph()))
+
+
+def test_unchanged_scc_keeps_prior_order(graph, components):
+    """Test that an SCC with unchanged relationships keeps its prior order."""
+    prior = MDTOGOrderGenerator(graph).generate_order()
+    add_outside_edge(graph, components)
+
+    generator = MDTOGOrderGenerator(graph)
+    sccs = mdtog_sccs(generator)
+    reusable = generator._reusable_scc_orders(sccs, set(), prior)
+
+    first_cycle = set(components[:3])
+    index = next(i for i, scc in enumerate(sccs) if scc == first_cycle)
+    assert reusable[index] == [c for c in prior.order if c in first_cycle]
+
+    result = generator.regenerate_order(set(), prior)
+    assert [c for c in result.order if c in first_cycle] == reusable[index]
+
+
+def test_changed_internal_edge_forces_recompute(graph, components):
+    """Test that an SCC whose internal relationships changed is not reused."""
+    prior = MDTOGOrderGenerator(graph).generate_order()
+    add_inside_edge(graph, components)
+
+    generator = MDTOGOrderGenerator(graph)
+    sccs = mdtog_sccs(generator)
+    reusable = generator._reusable_scc_orders(sccs, set(), prior)
+
+    assert set(components[:3]) not in [sccs[i] for i in reusable]
+    assert set(components[3:5]) in [sccs[i] for i in reusable]
+
+
+def test_changed_component_forces_recompute(graph, components):
+    """Test that an SCC containing a changed component is not reused."""
+    prior = MDTOGOrderGenerator(graph).generate_order()
+
+    generator = MDTOGOrderGenerator(graph)
+    sccs = mdtog_sccs(generator)
+    reusable = generator._reusable_scc_orders(sccs, {components[0]}, prior)
+
+    assert [sccs[i] for i in reusable] == [set(components[3:5])]
+
+
+@pytest.mark.parametrize("generator_class", [BLWOrderGenerator, MDTOGOrderGenerator, TJJMOrderGenerator])
+def test_unchanged_graph_returns_prior(graph, generator_class):
+    """Test that regenerating for an unchanged graph returns the prior result."""
+    prior = generator_class(graph).generate_order()
+    assert generator_class(graph).regenerate_order(set(), prior) is prior
+
+
+@pytest.mark.parametrize("generator_class", [BLWOrderGenerator, TJJMOrderGenerator])
+def test_cycle_breaking_reuses_unchanged_sccs(graph, components, generator_class, monkeypatch):
+    """Test that BLW and TJJM keep the removed edges of unchanged SCCs."""
+    prior = generator_class(graph).generate_order()
+    add_outside_edge(graph, components)
+
+    generator = generator_class(graph)
+    broken = []
+    find_edges = generator._find_edges_to_break_cycle
+    monkeypatch.setattr(
+        generator, "_find_edges_to_break_cycle",
+        lambda graph, scc: broken.append(scc) or find_edges(graph, scc)
+    )
+    result = generator.regenerate_order(set(), prior)
+
+    assert broken == []
+    for component in components[:5]:
+        assert result.stubs[component] == prior.stubs[component]
+    assert generator.validate_order(result.order)
+
+
+@pytest.mark.parametrize("generator_class", [BLWOrderGenerator, TJJMOrderGenerator])
+def test_cycle_breaking_recomputes_changed_sccs(graph, components, generator_class, monkeypatch):
+    """Test that BLW and TJJM break the cycles of a changed SCC again."""
+    prior = generator_class(graph).generate_order()
+    add_inside_edge(graph, components)
+
+    generator = generator_class(graph)
+    broken = []
+    find_edges = generator._find_edges_to_break_cycle
+    monkeypatch.setattr(
+        generator, "_find_edges_to_break_cycle",
+        lambda graph, scc: broken.append(scc) or find_edges(graph, scc)
+    )
+    result = generator.regenerate_order(set(), prior)
+
+    assert broken == [set(components[:3])]
+    assert generator.validate_order(result.order)
@@ -0,0 +1,137 @@
+"""Unit tests for the test order algorithm selector."""
+
+import threading
+
+import pytest
+
+from src.models.component import Component
+from src.models.relationship import Relationship
+from src.models.dependency_graph import DependencyGraph
+from src.strategy.test_order.blw import BLWOrderGenerator
+from src.strategy.test_order.tjjm import TJJMOrderGenerator
+from src.strategy.test_order_selector import TestOrderSelector
+
+
+def make_graph(count, edges):
+    """Create a dependency graph of `count` components joined by index pairs."""
+    graph = DependencyGraph()
+    components = [
+        Component(name=f"Component{i}", component_type="class", location=f"file{i}.py")
+        for i in range(count)
+    ]
+    for component in components:
+        graph.add_component(component)
+    for source, target in edges:
+        graph.add_relationship(Relationship(components[source], components[target], "association"))
+    return graph, components
+
+
+@pytest.fixture
+def layered_graph():
+    """Create an acyclic dependency graph with a few layers."""
+    graph, _ = make_graph(6, [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (5, 4)])
+    return graph
+
+
+def record_generate_order(generator):
+    """Replace a generator's generate_order with one recording its results."""
+    results = []
+    generate_order = generator.generate_order
+
+    def recording():
+        results.append(generate_order())
+        return results[-1]
+
+    generator.generate_order = recording
+    return results
+
+
+def test_select_best_generates_each_order_once(layered_graph):
+    """Test that the winner's result is the one generated for the comparison."""
+    selector = TestOrderSelector(layered_graph)
+    generated = {name: record_generate_order(algorithm) for name, algorithm in selector.algorithms.items()}
+
+    best, result, justification = selector.select_best_algorithm()
+
+    assert all(len(results) == 1 for results in generated.values())
+    assert result is generated[best][0]
+    assert justification[0] == f"Selected {best} as the best algorithm based on:"
+
+
+def test_comparisons_are_not_cached_across_calls(layered_graph):
+    """Test that every comparison generates the orders again."""
+    selector = TestOrderSelector(layered_graph)
+    generated = {name: record_generate_order(algorithm) for name, algorithm in selector.algorithms.items()}
+
+    selector.compare_algorithms()
+    selector.compare_algorithms()
+
+    assert all(len(results) == 2 for results in generated.values())
+
+
+def test_selector_uses_graph_as_constructed(layered_graph):
+    """Test that edits after construction are ignored until a new selector is created."""
+    selector = TestOrderSelector(layered_graph)
+    original = set(layered_graph.get_components())
+
+    added = Component(name="Added", component_type="class", location="added.py")
+    layered_graph.add_component(added)
+    layered_graph.add_relationship(Relationship(added, next(iter(original)), "association"))
+
+    _, result, _ = selector.select_best_algorithm()
+    assert set(result.order) == original
+
+    _, result, _ = TestOrderSelector(layered_graph).select_best_algorithm()
+    assert set(result.order) == original | {added}
+
+
+@pytest.mark.parametrize("generator_class", [BLWOrderGenerator, TJJMOrderGenerator])
+@pytest.mark.parametrize("edges", [
+    [(0, 1), (1, 2)],
+    [(0, 1), (1, 2), (2, 0)],
+])
+def test_generator_ignores_components_added_later(generator_class, edges):
+    """Test that generators order the components they were constructed with."""
+    graph, components = make_graph(3, edges)
+    generator = generator_class(graph)
+
+    added = Component(name="Added", component_type="class", location="added.py")
+    graph.add_component(added)
+    graph.add_relationship(Relationship(added, components[0], "association"))
+    graph.add_relationship(Relationship(components[2], added, "association"))
+
+    result = generator.generate_order()
+    assert sorted(c.name for c in result.order) == ["Component0", "Component1", "Component2"]
+    assert generator.validate_order(result.order)
+
+
+def order_names(results):
+    """Summarize generated orders by component names."""
+    return {name: [c.name for c in result.order] for name, result in results.items()}
+
+
+def test_pooled_generation_matches_in_process(layered_graph, monkeypatch):
+    """Test that orders generated in worker processes match in-process ones."""
+    monkeypatch.setattr("src.strategy.test_order_selector.MIN_PARALLEL_COMPONENTS", 1)
+    selector = TestOrderSelector(layered_graph)
+    components = set(layered_graph.get_components())
+
+    pooled = selector._generate_orders(num_processors=3)
+    in_process = selector._generate_orders(num_processors=1)
+
+    assert order_names(pooled) == order_names(in_process)
+    for result in pooled.values():
+        # Results are rebound to the graph's own component objects
+        assert all(any(c is own for own in components) for c in result.order)
+
+
+def test_pooled_generation_falls_back_in_process(layered_graph, monkeypatch):
+    """Test that a graph that cannot be pickled is ordered in-process."""
+    monkeypatch.setattr("src.strategy.test_order_selector.MIN_PARALLEL_COMPONENTS", 1)
+    layered_graph.get_components()[0].metadata["lock"] = threading.Lock()
+    selector = TestOrderSelector(layered_graph)
+
+    results = selector._generate_orders(num_processors=3)
+
+    assert set(results) == set(selector.algorithms)
+    assert order_names(results) == order_names(selector._generate_orders(num_processors=1))
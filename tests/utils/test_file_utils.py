@@ -0,0 +1,185 @@
+"""Tests for file utility functions."""
+
+import fnmatch
+import hashlib
+from pathlib import PurePosixPath
+
+import pytest
+
+from src.utils import file_utils
+from src.utils.file_utils import compile_glob_patterns, filter_files, get_file_hash, safe_write_file
+
+
+SCANNER_EXCLUDES = [
+    "**/__pycache__/**",
+    "**/*.pyc",
+    "**/.git/**",
+    "**/node_modules/**",
+    "**/venv/**",
+    "**/bin/**",
+    "**/obj/**",
+]
+
+
+@pytest.fixture
+def file_tree(tmp_path):
+    """Create a directory tree with files at several depths."""
+    files = [
+        "setup.py",
+        "README.md",
+        "src/app.py",
+        "src/app.pyc",
+        "src/__pycache__/app.cpython-311.pyc",
+        "src/pkg/module.py",
+        "src/pkg/data.txt",
+        "src/pkg/__pycache__/module.cpython-311.pyc",
+        "src/bin/tool.py",
+        "tests/test_app.py",
+        "node_modules/lib/index.js",
+        "node_modules/lib/setup.py",
+        "venv/lib/site.py",
+        ".git/config",
+        "docs/a1.md",
+        "docs/b2.md",
+        "obj/Debug/App.cs",
+        "App/Program.cs",
+    ]
+    for name in files:
+        path = tmp_path / "tree" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name * (3 if name.endswith(".txt") else 1))
+    return tmp_path / "tree"
+
+
+def rglob_filter(directory, include_patterns=None, exclude_patterns=None, max_size=None):
+    """Filter files with `Path.rglob`, as a reference for `filter_files`.
+
+    Before Python 3.13 a trailing `**` only matches directories, so files
+    below an excluded directory are excluded explicitly.
+    """
+    matching = set()
+    for pattern in include_patterns or ["*"]:
+        matching.update(directory.rglob(pattern))
+    for pattern in exclude_patterns or []:
+        matching -= set(directory.rglob(pattern))
+        if pattern.endswith("/**"):
+            matching -= set(directory.rglob(pattern + "/*"))
+    if max_size is not None:
+        matching = {f for f in matching if f.is_file() and f.stat().st_size <= max_size}
+    return sorted(matching)
+
+
+@pytest.mark.parametrize("pattern", ["*.py", "*.pyc", "setup.*", "?1.md", "[ab]*.md", "[!a]*.md", "[^a]*.md", "[]a]*.md", "*", "app.py"])
+@pytest.mark.parametrize("name", ["setup.py", "app.pyc", "a1.md", "b2.md", "c3.md", "app.py", ".hidden", "x.py.bak"])
+def test_single_component_pattern_matches_fnmatch(pattern, name):
+    """Test that patterns without separators match names like fnmatch."""
+    assert bool(compile_glob_patterns([pattern]).match(name)) == fnmatch.fnmatchcase(name, pattern)
+
+
+@pytest.mark.parametrize("pattern", ["*.py", "pkg/*.py", "src/*/module.py", "*.md"])
+@pytest.mark.parametrize("path", ["setup.py", "src/app.py", "src/pkg/module.py", "docs/a1.md", "src/pkg/data.txt"])
+def test_pattern_matches_at_any_depth(pattern, path):
+    """Test that relative patterns match the end of a path, like `PurePath.match`."""
+    assert bool(compile_glob_patterns([pattern]).match(path)) == PurePosixPath(path).match(pattern)
+
+
+@pytest.mark.parametrize("path, excluded", [
+    ("src/__pycache__/app.cpython-311.pyc", True),
+    ("src/pkg/__pycache__", False),
+    ("src/pkg/__pycache__/", True),
+    ("node_modules/lib/setup.py", True),
+    ("src/bin/tool.py", True),
+    ("src/binary.py", False),
+    ("src/app.pyc", True),
+    ("src/app.py", False),
+])
+def test_double_star_excludes(path, excluded):
+    """Test that `**` spans directories and a trailing `/**` matches everything below."""
+    assert bool(compile_glob_patterns(SCANNER_EXCLUDES).match(path)) == excluded
+
+
+def test_empty_patterns_match_nothing():
+    """Test that an empty pattern list matches no path."""
+    assert compile_glob_patterns([]).match("") is None
+    assert compile_glob_patterns([]).match("setup.py") is None
+
+
+@pytest.mark.parametrize("include, exclude, max_size", [
+    (None, None, None),
+    (["*.py"], None, None),
+    (["**/*.py", "**/*.cs"], SCANNER_EXCLUDES, 1024 * 1024),
+    (["*.py", "*.txt"], ["**/.git/**", "src/**"], 20),
+    (["*"], ["**/pkg/**"], None),
+    (["pkg/*.py"], ["*.txt"], None),
+    (["*.md"], ["[a]*.md"], None),
+])
+def test_filter_files_matches_rglob(file_tree, include, exclude, max_size):
+    """Test that filter_files selects the same files as rglob-based filtering."""
+    assert filter_files(file_tree, include, exclude, max_size) == rglob_filter(file_tree, include, exclude, max_size)
+
+
+def test_filter_files_does_not_walk_excluded_directories(file_tree, monkeypatch):
+    """Test that directories excluded with a trailing `/**` are pruned from the walk."""
+    walked = []
+    walk = file_utils._walk
+
+    def recording(directory, prefix, prune_re):
+        walked.append(prefix)
+        return walk(directory, prefix, prune_re)
+
+    monkeypatch.setattr(file_utils, "_walk", recording)
+    filter_files(file_tree, ["*.py"], SCANNER_EXCLUDES)
+
+    assert "src/" in walked
+    assert not any(prefix.startswith(("node_modules/", "venv/", ".git/", "src/__pycache__/")) for prefix in walked)
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """Create a file larger than the hash read buffer."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 5000)
+    return path
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "md5", "blake2b"])
+def test_get_file_hash(data_file, algorithm):
+    """Test that file hashes match hashlib over the whole content."""
+    expected = hashlib.new(algorithm, data_file.read_bytes()).hexdigest()
+    assert get_file_hash(data_file, algorithm) == expected
+    assert get_file_hash(str(data_file), algorithm) == expected
+
+
+def test_get_file_hash_without_file_digest(data_file, monkeypatch):
+    """Test the buffered fallback used before Python 3.11."""
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    monkeypatch.setattr(file_utils, "_HASH_BUFFER_SIZE", 4096)
+
+    expected = hashlib.sha256(data_file.read_bytes()).hexdigest()
+    assert get_file_hash(data_file) == expected
+
+
+def test_get_file_hash_empty_file(tmp_path):
+    """Test hashing an empty file."""
+    path = tmp_path / "empty"
+    safe_write_file(path, "")
+    assert get_file_hash(path) == hashlib.sha256(b"").hexdigest()
+
+
+def test_get_file_hash_missing_file(tmp_path):
+    """Test that hashing a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        get_file_hash(tmp_path / "missing")
+
+
+def test_get_file_hash_blake3_requires_package(data_file, monkeypatch):
+    """Test that blake3 hashes need the optional blake3 package."""
+    monkeypatch.setattr(file_utils, "blake3", None)
+    with pytest.raises(ImportError):
+        get_file_hash(data_file, "blake3")
+
+
+def test_get_file_hash_blake3(data_file):
+    """Test blake3 hashes when the optional package is installed."""
+    blake3 = pytest.importorskip("blake3")
+    assert get_file_hash(data_file, "blake3") == blake3.blake3(data_file.read_bytes()).hexdigest()
@@ -0,0 +1,34 @@
+"""Tests for the structured logger."""
+
+import logging
+
+from src.utils.logging import StructuredLogger
+
+
+def test_loggers_share_file_handler(tmp_path):
+    """Test that constructing a logger again reuses its file handler."""
+    first = StructuredLogger("test_shared_handler", log_dir=str(tmp_path))
+    second = StructuredLogger("test_shared_handler", log_dir=str(tmp_path))
+
+    assert first.logger.handlers == second.logger.handlers
+
+
+def test_old_file_handler_closed(tmp_path):
+    """Test that a logger writing to a new log file closes the old one."""
+    old = StructuredLogger("test_replaced_handler", log_dir=str(tmp_path / "old"))
+    old_handler = old.logger.handlers[1]
+
+    new = StructuredLogger("test_replaced_handler", log_dir=str(tmp_path / "new"))
+
+    assert new.logger.handlers[1] is not old_handler
+    assert old_handler.stream is None
+    assert old_handler not in new.logger.handlers
+
+
+def test_records_propagate_to_root(tmp_path, caplog):
+    """Test that records still reach handlers configured on the root logger."""
+    structured = StructuredLogger("test_propagation", log_dir=str(tmp_path))
+    with caplog.at_level(logging.INFO):
+        structured.info("hello", extra={"key": "value"})
+
+    assert [record.getMessage() for record in caplog.records] == ["hello"]